@@ -4,10 +4,11 @@ Main thread: MicroPython handling the UI.
 import time
 from pyscript import when, workers
 from pyscript.web import page
+from pyscript.workers import stream
 
 
-# A flag to track whether the computation is running.
-_computing = False
+# The running computation (a stream of updates from the worker), if any.
+_task = None
 
 
 @when("click", "#find-btn")
@@ -15,7 +16,7 @@ async def find_primes(event):
     """
     Ask the worker to find primes.
     """
-    global _computing
+    global _task
     find_btn = page["#find-btn"]
     stop_btn = page["#stop-btn"]
     limit_input = page["#limit"]
@@ -32,30 +33,36 @@ async def find_primes(event):
     # Check if numpy should be used.
     use_numpy = page["#use-numpy"].checked
     # Update UI state.
-    _computing = True
     find_btn.disabled = True
     stop_btn.disabled = False
     limit_input.disabled = True
     output.innerText = f"Computing primes up to {limit:,}..."
     try:
-        # Get the worker and call its exported function.
+        # Get the worker and stream updates from its exported function.
         worker = await workers["primes"]
         # Time the computation.
         start = time.time()
-        result = await worker.find_primes(limit, use_numpy)
-        elapsed = time.time() - start
-        if _computing:
+        _task = stream(worker, "find_primes", limit, use_numpy)
+        async for update in _task:
+            if update["kind"] == "progress":
+                output.innerText = (
+                    f"Computing primes up to {limit:,}... {update['percent']}%"
+                )
+                continue
+            elapsed = time.time() - start
             # Convert to string properly.
-            first_20 = result['first_20']
+            first_20 = update["first_20"]
             primes_str = ", ".join(str(p) for p in first_20)
             method = "NumPy" if use_numpy else "Pure Python"
             # Display the results in the UI.
-            output.innerText = f"Found {result['count']:,} primes up to {limit:,}!\n\nMethod: {method}\nTime: {elapsed:.3f} seconds\n\nFirst 20: {primes_str}"
+            output.innerText = f"Found {update['count']:,} primes up to {limit:,}!\n\nMethod: {method}\nTime: {elapsed:.3f} seconds\n\nFirst 20: {primes_str}"
+        if _task.cancelled:
+            output.innerText = "Stopped."
     except Exception as e:
         output.innerText = f"Error: {e}"
     finally:
         # Reset UI state.
-        _computing = False
+        _task = None
         find_btn.disabled = False
         stop_btn.disabled = True
         limit_input.disabled = False
@@ -64,17 +71,7 @@ async def find_primes(event):
 @when("click", "#stop-btn")
 async def stop_computation(event):
     """
-    Stop the computation (sets flag, updates UI, terminates the worker).
+    Cancel the computation. The worker stops and stays available.
     """
-    global _computing
-    _computing = False
-    output = page["#output"]
-    output.content = "Stopped (worker completed, but result discarded)"
-    find_btn = page["#find-btn"]
-    stop_btn = page["#stop-btn"]
-    limit_input = page["#limit"]
-    find_btn.disabled = False
-    stop_btn.disabled = True
-    limit_input.disabled = False
-    worker = await workers["primes"]
-    worker.terminate()
\ No newline at end of file
+    if _task:
+        await _task.cancel()
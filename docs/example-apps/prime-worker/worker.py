@@ -2,6 +2,7 @@
 Worker thread: Pyodide with numpy doing the computation.
 """
 import numpy as np
+from pyscript.workers import streamable
 
 
 def sieve_numpy(limit):
@@ -13,38 +14,51 @@ def sieve_numpy(limit):
     for i in range(2, int(limit**0.5) + 1):
         if is_prime[i]:
             is_prime[i*i::i] = False
-    primes = np.where(is_prime)[0]
-    return [int(p) for p in primes]
+    # Keep the result as a numpy array: no need for a list of Python ints.
+    return np.flatnonzero(is_prime)
 
 
-def sieve_python(limit):
+def sieve_python(limit, token):
     """
     Sieve of Eratosthenes using pure Python.
+
+    Yields progress updates along the way and stops early (returning None)
+    if the main thread cancels the task.
     """
     is_prime = [True] * (limit + 1)
     is_prime[0] = is_prime[1] = False
-    
-    for i in range(2, int(limit**0.5) + 1):
+    root = int(limit**0.5)
+    for i in range(2, root + 1):
+        if token.cancelled:
+            return None
         if is_prime[i]:
             for j in range(i*i, limit + 1, i):
                 is_prime[j] = False
+        if i % 10 == 0:
+            yield {"kind": "progress", "percent": i * 100 // root}
     return [i for i in range(limit + 1) if is_prime[i]]
 
 
-def find_primes(limit, use_numpy=True):
+@streamable
+def find_primes(token, limit, use_numpy=True):
     """
     Find all primes up to limit using Sieve of Eratosthenes.
+
+    Streams progress updates, then the result, back to the main thread.
     """
     if use_numpy:
-        primes_list = sieve_numpy(limit)
+        primes = sieve_numpy(limit)
     else:
-        primes_list = sieve_python(limit)
-    first_20 = [int(primes_list[i]) for i in range(min(20, len(primes_list)))]
-    return {
-        "count": len(primes_list),
-        "first_20": first_20
+        primes = yield from sieve_python(limit, token)
+    if primes is None:
+        # Cancelled by the main thread.
+        return
+    yield {
+        "kind": "result",
+        "count": len(primes),
+        "first_20": [int(p) for p in primes[:20]],
     }
 
 
 # Export functions to make them accessible from main thread.
-__export__ = ["find_primes"]
\ No newline at end of file
+__export__ = ["find_primes"]
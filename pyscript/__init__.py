@@ -35,15 +35,25 @@ The following names are available in the `pyscript` namespace:
 - `when`: Function to register event handlers on DOM elements.
 - `Event`: Class representing user defined or DOM events.
 - `py_import`: Function to lazily import Pyodide related Python modules.
+- `perf`: Module recording a timeline of where the page spends its time.
 
 If running in the main thread, the following additional names are available:
 
 - `create_named_worker`: Function to create a named Web Worker.
 - `workers`: Object to manage and interact with existing Web Workers.
+- `WorkerPool`: Class to spread work across a pool of identical workers.
 
 All of these names are defined in the various submodules of `pyscript` and
-are imported and re-exported here for convenience. Please refer to the
-respective submodule documentation for more details on each component.
+are re-exported here for convenience. Please refer to the respective
+submodule documentation for more details on each component.
+
+The submodules behind these names (except those from `pyscript.context`)
+are imported the first time one of their names is used, so pages which
+never touch them don't pay for loading them. In MicroPython, `display`,
+`fetch`, `storage` and `workers` are the exception: they're imported
+straight away, but put off importing their own dependencies until needed.
+How long each submodule took to import, in milliseconds, is recorded in
+the `import_times` dictionary.
 
 
 !!! Note
@@ -98,7 +108,24 @@ respective submodule documentation for more details on each component.
     as it works transparently in both the main thread and worker cases.
 """
 
+import js
 from polyscript import lazy_py_modules as py_import
+from pyscript import perf
+
+# How long, in milliseconds, each `pyscript` submodule took to import.
+import_times = {}
+
+
+def _imported(module, start):
+    """
+    Record that `module`, whose import began at `start`, has been imported.
+    """
+    end = js.performance.now()
+    import_times[module] = end - start
+    perf.record(f"import {module}", start, end)
+
+
+_start = js.performance.now()
 from pyscript.context import (
     RUNNING_IN_WORKER,
     PyWorker,
@@ -110,11 +137,92 @@ from pyscript.context import (
     sync,
     window,
 )
-from pyscript.display import HTML, display
-from pyscript.fetch import fetch
-from pyscript.storage import Storage, storage
-from pyscript.websocket import WebSocket
-from pyscript.events import when, Event
 
+_imported("pyscript.context", _start)
+
+# Name -> the submodule defining it, for names imported on first use.
+_LAZY = {
+    "HTML": "pyscript.display",
+    "display": "pyscript.display",
+    "fetch": "pyscript.fetch",
+    "Storage": "pyscript.storage",
+    "storage": "pyscript.storage",
+    "WebSocket": "pyscript.websocket",
+    "when": "pyscript.events",
+    "Event": "pyscript.events",
+}
 if not RUNNING_IN_WORKER:
-    from pyscript.workers import create_named_worker, workers
+    _LAZY["WorkerPool"] = "pyscript.workers"
+    _LAZY["create_named_worker"] = "pyscript.workers"
+    _LAZY["workers"] = "pyscript.workers"
+
+__all__ = [
+    "RUNNING_IN_WORKER",
+    "PyWorker",
+    "config",
+    "current_target",
+    "document",
+    "import_times",
+    "js_import",
+    "js_modules",
+    "perf",
+    "py_import",
+    "sync",
+    "window",
+] + list(_LAZY)
+
+
+def __getattr__(name):
+    """
+    Import the submodule defining `name` the first time it's used, and
+    cache the result here so later lookups never come back.
+    """
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pyscript' has no attribute '{name}'")
+    start = js.performance.now()
+    value = getattr(__import__(module, None, None, [name]), name)
+    if module not in import_times:
+        _imported(module, start)
+    globals()[name] = value
+    return value
+
+
+# Once a submodule is imported, the import system binds it to this package
+# under its own name, so `pyscript.fetch` (say) would become the submodule
+# rather than the function of the same name.
+if config["type"] == "mpy":
+    # MicroPython can't intercept that, so these submodules (which keep their
+    # own heavier imports until they're needed) are imported straight away.
+    _start = js.performance.now()
+    from pyscript.display import HTML, display
+
+    _imported("pyscript.display", _start)
+    _start = js.performance.now()
+    from pyscript.fetch import fetch
+
+    _imported("pyscript.fetch", _start)
+    _start = js.performance.now()
+    from pyscript.storage import Storage, storage
+
+    _imported("pyscript.storage", _start)
+    if not RUNNING_IN_WORKER:
+        _start = js.performance.now()
+        from pyscript.workers import WorkerPool, create_named_worker, workers
+
+        _imported("pyscript.workers", _start)
+else:
+    import sys
+
+    class _Package(type(sys)):
+        """
+        This package, ignoring the import system's attempts to replace a
+        name with the submodule of the same name.
+        """
+
+        def __setattr__(self, name, value):
+            if isinstance(value, type(sys)) and _LAZY.get(name) == value.__name__:
+                return
+            super().__setattr__(name, value)
+
+    sys.modules[__name__].__class__ = _Package
@@ -11,8 +11,9 @@ Key features:
 
 - Detects whether code is running in a worker or main thread. Read this via
   the boolean `pyscript.context.RUNNING_IN_WORKER`.
-- Parses and normalizes configuration from `polyscript.config` and adds the
-  Python interpreter type via the `type` key in `pyscript.context.config`.
+- Exposes the configuration from `polyscript.config` as a lazily converted,
+  dict-like `pyscript.context.config`, and adds the Python interpreter type
+  via its `type` key.
 - Provides appropriate implementations of `window`, `document`, and `sync`.
 - Sets up JavaScript module import system, including a lazy `js_import`
   function.
@@ -44,15 +45,168 @@ import sys
 import js
 from polyscript import config as _polyscript_config
 from polyscript import js_modules
+from pyscript import perf
+from pyscript.ffi import JsProxy, is_none
 from pyscript.util import NotSupported
 
 RUNNING_IN_WORKER = not hasattr(js, "document")
 """Detect execution context: True if running in a worker, False if main thread."""
 
-config = json.loads(js.JSON.stringify(_polyscript_config))
-"""Parsed and normalized configuration."""
-if isinstance(config, str):
-    config = {}
+
+class _Config(dict):
+    """
+    A `dict` of the page's configuration, filled in from JavaScript as it's
+    read.
+
+    Converting the whole configuration from JavaScript is slow when it lists
+    many packages, files or fetch entries, so each key is only converted the
+    first time it is read. Anything that needs every key (iteration,
+    `len()`, `repr()`, comparison, `json.dumps()` and so on) converts the
+    rest in one go. Values set from Python take precedence over those from
+    the configuration.
+    """
+
+    def __init__(self, source):
+        super().__init__()
+        # A string means the configuration couldn't be parsed: treat it as
+        # empty, as does a missing one.
+        if isinstance(source, str) or is_none(source):
+            source = None
+        self._source = source
+        self._complete = source is None
+        if "MicroPython" in sys.version:
+            # MicroPython's dict subclasses bypass overridden methods in
+            # `json.dumps()`, `dict()` and the like, so convert it all now.
+            self._load()
+
+    def _pull(self, key):
+        """
+        Convert and keep the value of `key`, raising `KeyError` if the
+        configuration doesn't have it.
+        """
+        if self._complete or not isinstance(key, str):
+            raise KeyError(key)
+        if not js.Reflect.has(self._source, key):
+            raise KeyError(key)
+        value = js.Reflect.get(self._source, key)
+        if value is None:
+            # JavaScript `undefined`: treat it as missing, as JSON would.
+            raise KeyError(key)
+        if not isinstance(value, (bool, int, float, str)):
+            value = json.loads(js.JSON.stringify(value))
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _load(self):
+        """
+        Convert (once) every key not yet read or set.
+        """
+        if self._complete:
+            return
+        self._complete = True
+        for key, value in json.loads(js.JSON.stringify(self._source)).items():
+            if not dict.__contains__(self, key):
+                dict.__setitem__(self, key, value)
+
+    def __getitem__(self, key):
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            return self._pull(key)
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        try:
+            self._pull(key)
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __delitem__(self, key):
+        self._load()
+        dict.__delitem__(self, key)
+
+    def __iter__(self):
+        self._load()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._load()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._load()
+        if isinstance(other, _Config):
+            other._load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self._load()
+        return dict.__repr__(self)
+
+    def __or__(self, other):
+        self._load()
+        result = dict(dict.items(self))
+        result.update(other)
+        return result
+
+    def __ror__(self, other):
+        self._load()
+        result = dict(other)
+        result.update(dict.items(self))
+        return result
+
+    def __ior__(self, other):
+        # Keys set from Python take precedence, so there's nothing to load.
+        self.update(other)
+        return self
+
+    def keys(self):
+        self._load()
+        return dict.keys(self)
+
+    def values(self):
+        self._load()
+        return dict.values(self)
+
+    def items(self):
+        self._load()
+        return dict.items(self)
+
+    def copy(self):
+        """
+        Return the whole configuration as a plain `dict`.
+        """
+        self._load()
+        return dict(dict.items(self))
+
+    def pop(self, *args):
+        self._load()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._load()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+
+config = _Config(_polyscript_config)
+"""Configuration, converted from JavaScript one key at a time as it's read."""
 
 js_import = None
 """Function to import JavaScript modules dynamically."""
@@ -66,13 +220,19 @@ document = None
 sync = None
 """Sync utilities for worker-main thread communication (only in workers)."""
 
-# Detect and add Python interpreter type to config.
+# Detect and add Python interpreter type to config. (This also keeps the
+# underlying dict from being empty, which `json.dumps()` checks before it
+# asks for the items.)
 if "MicroPython" in sys.version:
     config["type"] = "mpy"
 else:
     config["type"] = "py"
 
 
+# Tells whether a JavaScript value is a function (created on first use).
+_is_function = None
+
+
 class _JSModuleProxy:
     """
     Proxy for JavaScript modules imported via js_modules.
@@ -81,17 +241,71 @@ class _JSModuleProxy:
     import syntax:
 
     ```python
-    from pyscript.js_modules lodash import debounce
+    from pyscript.js_modules.lodash import debounce
     ```
 
-    The proxy lazily retrieves the actual JavaScript module when accessed.
+    The proxy lazily retrieves the actual JavaScript module the first time
+    it's used, and caches each function (or class) it looks up as an
+    instance attribute, so later accesses cost no more than an ordinary
+    attribute lookup. Other values are looked up every time, since a module
+    may reassign them (`export let`). `from pyscript.js_modules.xxx import *`
+    looks up all the module's exports at once.
     """
 
     def __init__(self, name):
         """
         Create a proxy for the named JavaScript module.
         """
-        self.name = name
+        self._name = name
+        self._module = None
+
+    def _resolve(self):
+        """
+        Return the JavaScript module, looking it up only once.
+        """
+        if self._module is None:
+            self._module = getattr(js_modules, self._name)
+        return self._module
+
+    def _invalidate(self):
+        """
+        Forget the module and all cached fields, so they're looked up
+        afresh (e.g. after the module has been reloaded).
+        """
+        for field in list(self.__dict__):
+            if not field.startswith("_"):
+                delattr(self, field)
+        self._module = None
+
+    @property
+    def __all__(self):
+        """
+        The names the module exports, all looked up and cached at once.
+        """
+        module = self._resolve()
+        names = [
+            key
+            for key in js.Reflect.ownKeys(module)
+            if isinstance(key, str) and not key.startswith("_")
+        ]
+        for field in names:
+            self._cache(field, getattr(module, field))
+        return names
+
+    def _cache(self, field, value):
+        """
+        Keep `value` as the `field` attribute if it's a function (or class),
+        and return it.
+        """
+        global _is_function
+        if isinstance(value, JsProxy):
+            if _is_function is None:
+                _is_function = js.Function.new(
+                    "value", "return typeof value === 'function'"
+                )
+            if _is_function(value):
+                setattr(self, field, value)
+        return value
 
     def __getattr__(self, field):
         """
@@ -100,14 +314,35 @@ class _JSModuleProxy:
         """
         # Avoid Pyodide looking for non-existent special methods.
         if not field.startswith("_"):
-            return getattr(getattr(js_modules, self.name), field)
+            return self._cache(field, getattr(self._resolve(), field))
         return None
 
 
+def refresh_js_modules():
+    """
+    Make newly registered JavaScript modules importable via
+    `pyscript.js_modules.xxx`, and invalidate the cached fields of modules
+    that have been reloaded since they were first used.
+    """
+    for module_name in js.Reflect.ownKeys(js_modules):
+        key = f"pyscript.js_modules.{module_name}"
+        proxy = sys.modules.get(key)
+        if proxy is None:
+            sys.modules[key] = _JSModuleProxy(module_name)
+        elif proxy._module is not None:
+            # "is" is a Python keyword, hence getattr.
+            same = getattr(js.Object, "is")
+            if not same(proxy._module, getattr(js_modules, module_name)):
+                proxy._invalidate()
+
+
 # Register all available JavaScript modules in Python's module system.
 # This enables: from pyscript.js_modules.xxx import yyy
-for module_name in js.Reflect.ownKeys(js_modules):
-    sys.modules[f"pyscript.js_modules.{module_name}"] = _JSModuleProxy(module_name)
+with perf.span("register js_modules"):
+    for module_name in js.Reflect.ownKeys(js_modules):
+        sys.modules[f"pyscript.js_modules.{module_name}"] = _JSModuleProxy(
+            module_name
+        )
 sys.modules["pyscript.js_modules"] = js_modules
 
 
@@ -33,14 +33,20 @@ Heavily inspired by
 [IPython's rich display system](https://ipython.readthedocs.io/en/stable/api/generated/IPython.display.html).
 """
 
-import base64
-import html
-import io
-from collections import OrderedDict
 from pyscript.context import current_target, document, window
 from pyscript.ffi import is_none
 
 
+def _escape(text):
+    """
+    HTML-escape `text`. The `html` module is only imported when needed, to
+    keep importing this module cheap.
+    """
+    import html
+
+    return html.escape(text)
+
+
 def _render_image(mime, value, meta):
     """
     Render image (`mime`) data (`value`) as an HTML img element with data URL.
@@ -51,6 +57,8 @@ def _render_image(mime, value, meta):
     their raw XML content (which the browser can render directly).
     """
     if isinstance(value, bytes):
+        import base64
+
         value = base64.b64encode(value).decode("utf-8")
     attrs = "".join([f' {k}="{v}"' for k, v in meta.items()])
     return f'<img src="data:{mime};base64,{value}"{attrs}>'
@@ -58,7 +66,7 @@ def _render_image(mime, value, meta):
 
 # Maps MIME types to rendering functions.
 _MIME_TO_RENDERERS = {
-    "text/plain": lambda v, m: html.escape(v),
+    "text/plain": lambda v, m: _escape(v),
     "text/html": lambda v, m: v,
     "image/png": lambda v, m: _render_image("image/png", v, m),
     "image/jpeg": lambda v, m: _render_image("image/jpeg", v, m),
@@ -68,20 +76,18 @@ _MIME_TO_RENDERERS = {
 }
 
 
-# Maps Python representation methods to MIME types. This is an ordered dict
-# because the order defines preference when multiple methods are available,
-# and MicroPython's limited dicts don't preserve insertion order.
-_METHOD_TO_MIME = OrderedDict(
-    [
-        ("savefig", "image/png"),
-        ("_repr_png_", "image/png"),
-        ("_repr_jpeg_", "image/jpeg"),
-        ("_repr_svg_", "image/svg+xml"),
-        ("_repr_html_", "text/html"),
-        ("_repr_json_", "application/json"),
-        ("_repr_javascript_", "application/javascript"),
-        ("__repr__", "text/plain"),
-    ]
+# Maps Python representation methods to MIME types. These are pairs, not a
+# dict, because the order defines preference when multiple methods are
+# available, and MicroPython's limited dicts don't preserve insertion order.
+_METHOD_TO_MIME = (
+    ("savefig", "image/png"),
+    ("_repr_png_", "image/png"),
+    ("_repr_jpeg_", "image/jpeg"),
+    ("_repr_svg_", "image/svg+xml"),
+    ("_repr_html_", "text/html"),
+    ("_repr_json_", "application/json"),
+    ("_repr_javascript_", "application/javascript"),
+    ("__repr__", "text/plain"),
 )
 
 
@@ -120,6 +126,9 @@ def _get_representation(obj, method):
     if not hasattr(obj, method):
         return None
     if method == "savefig":
+        import base64
+        import io
+
         buf = io.BytesIO()
         obj.savefig(buf, format="png")
         buf.seek(0)
@@ -142,7 +151,7 @@ def _get_content_and_mime(obj):
     etc...).
     """
     if isinstance(obj, str):
-        return html.escape(obj), "text/plain"
+        return _escape(obj), "text/plain"
     # Prefer an object's mimebundle.
     mimebundle = _get_representation(obj, "_repr_mimebundle_")
     if mimebundle:
@@ -162,7 +171,7 @@ def _get_content_and_mime(obj):
                 return _MIME_TO_RENDERERS[mime_type](output, meta), mime_type
     # No mimebundle or no available renderers therein, so try individual
     # methods.
-    for method, mime_type in _METHOD_TO_MIME.items():
+    for method, mime_type in _METHOD_TO_MIME:
         if mime_type not in _MIME_TO_RENDERERS:
             continue
         output = _get_representation(obj, method)
@@ -178,7 +187,7 @@ def _get_content_and_mime(obj):
         "Using __repr__ as fallback."
     )
     output = repr(obj)
-    return html.escape(output), "text/plain"
+    return _escape(output), "text/plain"
 
 
 def _write_to_dom(element, value, append):
@@ -169,7 +169,7 @@ def when(event_type, selector=None, **options):
             for element in elements:
                 element.addEventListener(
                     event_type,
-                    create_proxy(wrapper),
+                    create_proxy(wrapper, owner=element),
                     to_js(options) if options else False,
                 )
         return wrapper
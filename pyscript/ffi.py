@@ -8,9 +8,22 @@ away the differences in their JavaScript interop APIs.
 The following utilities work on both the main thread and in worker contexts:
 
 - `create_proxy`: Create a persistent JavaScript proxy of a Python function.
-- `to_js`: Convert Python objects to JavaScript objects.
+- `destroy_proxy`: Destroy a proxy created by `create_proxy`.
+- `proxy_scope`: Destroy all the proxies created within a `with` block.
+- `release_proxies`: Destroy all the proxies belonging to an owner.
+- `auto_release`: Destroy the proxies of DOM elements once they're removed
+  from the page (main thread only, off by default).
+- `live_proxies` and `leak_report`: Diagnose proxies that are never
+  destroyed.
+- `to_js`: Convert Python objects to JavaScript objects (handling common
+  cases directly).
 - `is_none`: Check if a value is Python `None` or JavaScript `null`.
 - `assign`: Merge objects (like JavaScript's `Object.assign`).
+- `batch`: Group many DOM reads and writes into a single operation (one
+  round trip to the main thread, when used in a worker).
+- `to_typed_array`: Copy a Python buffer into a JavaScript typed array in bulk.
+- `from_typed_array`: Copy a JavaScript typed array into a Python
+  `memoryview` in bulk.
 
 The following utilities are specific to worker contexts:
 
@@ -22,10 +35,14 @@ More details of the `direct`, `gather`, and `query` utilities
 [can be found here](https://github.com/WebReflection/reflected-ffi?tab=readme-ov-file#remote-extra-utilities).
 """
 
+import json
+from array import array
+
 try:
     # Attempt to import Pyodide's FFI utilities.
     import js
     from pyodide.ffi import create_proxy as _cp
+    from pyodide.ffi import JsProxy
     from pyodide.ffi import to_js as _py_tjs
     from pyodide.ffi import jsnull
 
@@ -36,16 +53,202 @@ try:
             kw["dict_converter"] = from_entries
         return _py_tjs(value, **kw)
 
+    def _to_typed_array(buffer):
+        # Pyodide copies buffers into a matching TypedArray in one go, but
+        # turns multi-dimensional ones into nested arrays: flatten those
+        # (and strided ones, such as NumPy slices with a step, which can't
+        # be cast) into a contiguous copy, keeping the item type where
+        # possible.
+        view = memoryview(buffer)
+        if view.ndim > 1 or not view.c_contiguous:
+            flat = memoryview(view.tobytes())
+            try:
+                view = flat.cast(view.format)
+            except (TypeError, ValueError):
+                view = flat
+        return _py_tjs(view)
+
+    def _from_typed_array(typed_array):
+        # Pyodide copies TypedArrays into a matching memoryview in one go.
+        return typed_array.to_py()
+
 except:
     # Fallback to jsffi for MicroPython.
     from jsffi import create_proxy as _cp
+    from jsffi import JsProxy
     from jsffi import to_js as _to_js_wrapper
     import js
 
     jsnull = js.Object.getPrototypeOf(js.Object.prototype)
 
+    from binascii import a2b_base64, b2a_base64
+
+    # MicroPython only deals in raw bytes. Rather than crossing the FFI once
+    # per byte, they cross as a single base64 string, decoded (or encoded)
+    # on the JavaScript side by these helpers.
+    _from_base64 = js.Function.new(
+        "text",
+        """
+const binary = atob(text);
+const bytes = new Uint8Array(binary.length);
+for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+return bytes;
+""",
+    )
+    _to_base64 = js.Function.new(
+        "bytes",
+        """
+let binary = "";
+for (let i = 0; i < bytes.length; i += 0x8000)
+  binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+return btoa(binary);
+""",
+    )
+
+    def _to_typed_array(buffer):
+        return _from_base64(b2a_base64(bytes(buffer)).decode())
+
+    def _from_typed_array(typed_array):
+        ui8a = js.Uint8Array.new(
+            typed_array.buffer, typed_array.byteOffset, typed_array.byteLength
+        )
+        return memoryview(bytearray(a2b_base64(_to_base64(ui8a))))
+
+
+# id(proxy) -> (proxy, label) for every proxy not yet destroyed.
+_live_proxies = {}
+# Proxies created within each active `proxy_scope`, innermost last.
+_scopes = []
+# Owner key -> proxies created on behalf of that owner.
+_owned = {}
+_owner_count = 0
+# The MutationObserver releasing removed elements' proxies, if enabled.
+_removal_observer = None
+
+
+def _owner_key(owner, create=False):
+    """
+    Return a stable key for `owner`. JavaScript objects are tagged with
+    their key, since a new Python wrapper may be made each time they're
+    accessed.
+    """
+    global _owner_count
+    if not isinstance(owner, JsProxy):
+        return id(owner)
+    key = js.Reflect.get(owner, "__pyscript_owner__")
+    if is_none(key):
+        if not create:
+            return None
+        _owner_count += 1
+        key = f"owner-{_owner_count}"
+        js.Reflect.set(owner, "__pyscript_owner__", key)
+    return key
+
+
+# Returns (as JSON) the owner keys of a DOM `node` and its descendants.
+_OWNER_KEYS = """
+const keys = [];
+const add = element => {
+  const key = element.__pyscript_owner__;
+  if (key != null) keys.push(key);
+};
+if (node.nodeType === 1) {
+  add(node);
+  for (const element of node.querySelectorAll("*")) add(element);
+}
+return JSON.stringify(keys);
+"""
+_owner_keys = None
+
+# Returns a MutationObserver that calls `release` with (as JSON) the owner
+# keys of every DOM element removed from the page, and its descendants.
+# Elements moved elsewhere in the page, or added back before the next task,
+# are left alone.
+_WATCH_REMOVALS = """
+const ownerKeys = new Function("node", source);
+const observer = new MutationObserver(records => {
+  const removed = [];
+  for (const record of records) removed.push(...record.removedNodes);
+  setTimeout(() => {
+    const keys = [];
+    for (const node of removed)
+      if (!node.isConnected) keys.push(...JSON.parse(ownerKeys(node)));
+    if (keys.length) release(JSON.stringify(keys));
+  });
+});
+observer.observe(document, { childList: true, subtree: true });
+return observer;
+"""
+
 
-def create_proxy(func):
+def _release_keys(keys):
+    """
+    Destroy the proxies of the owners with the given `keys` (as JSON).
+    """
+    for key in json.loads(keys):
+        for proxy in _owned.pop(key, []):
+            destroy_proxy(proxy)
+
+
+def _release_tree(node):
+    """
+    Destroy the proxies owned by the DOM `node` and all its descendants.
+    From a worker, this is a single round trip to the main thread.
+    """
+    global _owner_keys
+    if _owner_keys is None:
+        from pyscript.context import window
+
+        _owner_keys = window.Function.new("node", _OWNER_KEYS)
+    _release_keys(_owner_keys(node))
+
+
+def auto_release(enabled=True):
+    """
+    On the main thread, destroy the proxies owned by DOM elements (such as
+    `@when` handlers) automatically, once an element, or one of its
+    ancestors, is removed from the page, however that happens. Pass
+    `enabled=False` to stop doing so. Returns whether it's enabled.
+
+    This is off by default, since an element that's removed and only added
+    back later (after the current task) loses its event handlers. Elements
+    that are moved, or removed and re-added straight away, keep them.
+
+    ```python
+    from pyscript import ffi
+
+
+    ffi.auto_release()
+    ```
+
+    In a worker this does nothing (and returns `False`): watching the page
+    from a worker would cost a round trip per change. Use `release_proxies()`
+    or a `pyscript.web` element's `remove(release=True)` there instead.
+    """
+    global _removal_observer
+    if not hasattr(js, "document"):
+        return False
+    if enabled and _removal_observer is None:
+        watch = js.Function.new("source", "release", _WATCH_REMOVALS)
+        _removal_observer = watch(_OWNER_KEYS, _create_proxy(_release_keys))
+    elif not enabled and _removal_observer is not None:
+        _removal_observer.disconnect()
+        _removal_observer = None
+    return enabled
+
+
+def _create_proxy(func):
+    """
+    Create a tracked proxy of `func` that isn't captured by any active
+    `proxy_scope()`. For the long-lived proxies PyScript creates for
+    itself, which must outlive whatever scope they happen to be made in.
+    """
+    proxy = _cp(func)
+    _live_proxies[id(proxy)] = (proxy, getattr(func, "__name__", repr(func)))
+    return proxy
+
+
+def create_proxy(func, owner=None):
     """
     Create a persistent JavaScript proxy of a Python function.
 
@@ -67,11 +270,227 @@ def create_proxy(func):
 
     my_button.addEventListener("click", ffi.create_proxy(py_callback))
     ```
+
+    Persistent proxies live until they're destroyed, so a long running
+    page that keeps creating them leaks memory. Destroy a proxy you no
+    longer need with `destroy_proxy()`, or create it inside a
+    `proxy_scope()`, or give it an `owner` (e.g. the DOM element it
+    listens to) and call `release_proxies(owner)` when the owner goes away.
+    With `auto_release()` enabled, proxies owned by a DOM element are
+    destroyed automatically once it's removed from the page. A proxy with an
+    owner lives as long as its owner, so isn't destroyed by a
+    `proxy_scope()`.
+    """
+    proxy = _create_proxy(func)
+    if owner is None:
+        if _scopes:
+            _scopes[-1].append(proxy)
+    else:
+        _owned.setdefault(_owner_key(owner, create=True), []).append(proxy)
+    return proxy
+
+
+def destroy_proxy(proxy):
+    """
+    Destroy a `proxy` made by `create_proxy()`, so the Python function it
+    wraps can be freed. Calling it from JavaScript afterwards is an error.
+    Destroying a proxy twice does nothing.
+
+    (MicroPython doesn't support destroying proxies, so there this only
+    stops tracking the proxy.)
+    """
+    if _live_proxies.pop(id(proxy), None) is None:
+        return
+    destroy = getattr(proxy, "destroy", None)
+    if destroy:
+        destroy()
+
+
+def release_proxies(owner):
+    """
+    Destroy all the proxies created with the given `owner`.
+
+    ```python
+    from pyscript import ffi, document
+
+
+    button = document.getElementById("my-button")
+    button.addEventListener("click", ffi.create_proxy(handler, owner=button))
+
+    # Later, when the button is no longer needed.
+    button.remove()
+    ffi.release_proxies(button)
+    ```
+
+    To do this for a `pyscript.web` element and all its descendants, call
+    its `remove(release=True)` method. On the main thread, `auto_release()`
+    makes it happen whenever a DOM element owner (or one of its ancestors)
+    is removed from the page.
     """
-    return _cp(func)
+    key = _owner_key(owner)
+    for proxy in _owned.pop(key, []):
+        destroy_proxy(proxy)
 
 
-def to_js(value, **kw):
+class ProxyScope:
+    """
+    Tracks the proxies created by `create_proxy()` within a `with` block,
+    and destroys them at the end of it. Created via `proxy_scope()`.
+
+    Proxies given an `owner`, and those PyScript creates for its own
+    long-lived use (e.g. for WebSocket handlers), are not tracked.
+    """
+
+    def __init__(self):
+        self.proxies = []
+        """The proxies created within the scope."""
+
+    def __enter__(self):
+        _scopes.append(self.proxies)
+        return self
+
+    def __exit__(self, *args):
+        # Find this scope's own list by identity: an empty list equals any
+        # other, so `remove()` could take the wrong one.
+        for index in range(len(_scopes) - 1, -1, -1):
+            if _scopes[index] is self.proxies:
+                del _scopes[index]
+                break
+        self.destroy()
+
+    def destroy(self):
+        """
+        Destroy all the proxies created within the scope so far.
+        """
+        for proxy in self.proxies:
+            destroy_proxy(proxy)
+        self.proxies.clear()
+
+
+def proxy_scope():
+    """
+    Return a `ProxyScope` context manager: all the proxies created by
+    `create_proxy()` within the `with` block are destroyed at the end.
+
+    ```python
+    from pyscript import ffi
+    import js
+
+
+    with ffi.proxy_scope():
+        callback = ffi.create_proxy(lambda value: print(value))
+        js.someLibrary.process(data, callback)
+    # callback has now been destroyed.
+    ```
+    """
+    return ProxyScope()
+
+
+def live_proxies():
+    """
+    Return the number of proxies created by `create_proxy()` that have
+    not been destroyed. If this keeps growing, proxies are leaking.
+    """
+    return len(_live_proxies)
+
+
+def leak_report(top=10):
+    """
+    Return a list of `(name, count)` pairs for the `top` Python functions
+    with the most live proxies, most first. Useful for finding out what is
+    creating proxies that are never destroyed.
+
+    ```python
+    from pyscript import ffi
+
+
+    print(ffi.live_proxies())  # 1523
+    print(ffi.leak_report(3))  # [("on_message", 1500), ...]
+    ```
+    """
+    counts = {}
+    for _, label in _live_proxies.values():
+        counts[label] = counts.get(label, 0) + 1
+    return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+# Immutable values already converted by `to_js`, keyed by their repr.
+_js_cache = {}
+_JS_CACHE_SIZE = 256
+_PRIMITIVES = (str, int, float, bool)
+# Beyond this, integers lose precision as JavaScript numbers.
+_MAX_SAFE_INT = 2**53 - 1
+_INFINITY = float("inf")
+
+
+def _safe_int(item):
+    """
+    Return True unless `item` is an integer too big for a JavaScript number
+    (which the generic converter turns into a `BigInt` instead).
+    """
+    return not isinstance(item, int) or -_MAX_SAFE_INT <= item <= _MAX_SAFE_INT
+
+
+def _cacheable(value):
+    """
+    Return True if `value` is a tuple of primitive values (or of other such
+    tuples), so its conversion can be cached.
+    """
+    for item in value:
+        if isinstance(item, tuple):
+            if not _cacheable(item):
+                return False
+        elif item is not None and not isinstance(item, _PRIMITIVES):
+            return False
+        elif not _safe_int(item):
+            return False
+    return True
+
+
+def _json_safe(value):
+    """
+    Return True if `value` is a flat dict of primitive values that becomes
+    the same JavaScript object via JSON as it would via the generic path.
+    """
+    for key, item in value.items():
+        if not isinstance(key, str) or not isinstance(item, _PRIMITIVES):
+            return False
+        if not _safe_int(item):
+            return False
+        if isinstance(item, float) and (
+            item != item or item == _INFINITY or item == -_INFINITY
+        ):
+            return False
+    return True
+
+
+def _to_numbers(value):
+    """
+    Convert a list of numbers to an `Int32Array` (if they're all integers
+    that fit) or a `Float64Array`. Returns None for any other list.
+    """
+    if not value:
+        return None
+    integers = True
+    for item in value:
+        if isinstance(item, int) and not isinstance(item, bool):
+            if not _safe_int(item):
+                return None
+            if integers and not -(2**31) <= item < 2**31:
+                integers = False
+        elif isinstance(item, float):
+            integers = False
+        else:
+            return None
+    code, js_type = ("i", js.Int32Array) if integers else ("d", js.Float64Array)
+    typed_array = _to_typed_array(array(code, value))
+    if typed_array.BYTES_PER_ELEMENT == 1:
+        # MicroPython only deals in raw bytes, so view them as numbers.
+        typed_array = js_type.new(typed_array.buffer, 0, len(value))
+    return typed_array
+
+
+def to_js(value, typed=False, cache=False, **kw):
     """
     Convert Python objects to JavaScript objects.
 
@@ -95,8 +514,96 @@ def to_js(value, **kw):
 
     js.Notification.new("Hello!", ffi.to_js(note))
     ```
+
+    Common cases avoid the interpreter's generic (recursive) converter:
+
+    - Strings, numbers and booleans are returned as they are.
+    - Flat dictionaries of strings, numbers and booleans are converted in
+      a single step via JSON.
+    - With `cache=True`, tuples of primitive values are converted once,
+      and the resulting JavaScript array is frozen (so it can't be
+      changed) and shared by every later conversion of an equal tuple.
+    - With `typed=True`, a list of numbers becomes an `Int32Array` (if they
+      are all integers that fit) or a `Float64Array`, copied in bulk.
+
+    Integers too big for a JavaScript number always take the generic path
+    (which turns them into a `BigInt`, where supported).
+
+    Passing any other keyword arguments (such as `dict_converter`) always
+    uses the generic converter.
+    """
+    if kw:
+        return _to_js_wrapper(value, **kw)
+    kind = type(value)
+    if value is None or kind in _PRIMITIVES:
+        return value
+    if kind is dict:
+        if _json_safe(value):
+            return js.JSON.parse(json.dumps(value))
+    elif kind is tuple and cache:
+        if _cacheable(value):
+            key = repr(value)
+            cached = _js_cache.get(key)
+            if cached is None:
+                if len(_js_cache) >= _JS_CACHE_SIZE:
+                    del _js_cache[next(iter(_js_cache))]
+                cached = js.Object.freeze(_to_js_wrapper(value))
+                _js_cache[key] = cached
+            return cached
+    elif kind is list and typed:
+        typed_array = _to_numbers(value)
+        if typed_array is not None:
+            return typed_array
+    return _to_js_wrapper(value)
+
+
+def to_typed_array(buffer):
     """
-    return _to_js_wrapper(value, **kw)
+    Copy a Python `buffer` (`bytes`, `bytearray`, `memoryview`,
+    `array.array` or a NumPy array) into a new JavaScript
+    [typed array](https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/TypedArray).
+
+    The whole buffer is copied in bulk, and multi-dimensional or strided
+    buffers (such as NumPy slices with a step) are flattened (in row-major
+    order). In Pyodide the typed array matches the
+    buffer's item type (e.g. a `float64` NumPy array becomes a
+    `Float64Array`). In MicroPython the result is always a `Uint8Array` of
+    the buffer's raw bytes.
+
+    This is much cheaper than converting to a list of Python numbers, and
+    typed arrays can be passed to, and returned from, worker functions.
+
+    ```python
+    import numpy as np
+    from pyscript import ffi
+
+
+    data = np.arange(1_000_000, dtype=np.float64)
+    js_data = ffi.to_typed_array(data)  # A Float64Array.
+    ```
+    """
+    return _to_typed_array(buffer)
+
+
+def from_typed_array(typed_array):
+    """
+    Copy a JavaScript typed array (or `DataView`) into a Python
+    `memoryview`.
+
+    In Pyodide the `memoryview` has the same item type as the typed array,
+    so it can be handed straight to NumPy without further copies (via
+    `numpy.asarray`). In MicroPython the `memoryview` is always over the
+    raw bytes.
+
+    ```python
+    import numpy as np
+    from pyscript import ffi
+
+
+    values = np.asarray(ffi.from_typed_array(await worker.compute()))
+    ```
+    """
+    return _from_typed_array(typed_array)
 
 
 def is_none(value):
@@ -162,3 +669,202 @@ def assign(source, *args):
     for arg in args:
         _assign(source, to_js(arg))
     return source
+
+
+# Runs a batch of operations on the main thread: `ops` is a JSON list of
+# [operation, target index, selector, path, value] and the remaining
+# arguments are the targets. Returns the JSON list of results.
+_BATCH_RUNNER = """
+const resolve = (object, path) =>
+  path ? path.split(".").reduce((o, key) => o[key], object) : object;
+const results = [];
+for (const [op, target, selector, path, value] of JSON.parse(ops)) {
+  const root = target < 0 ? document : targets[target];
+  const objects = selector === null ? [root] : [...root.querySelectorAll(selector)];
+  const keys = path.split(".");
+  const last = keys.pop();
+  const parents = objects.map((o) => resolve(o, keys.join(".")));
+  if (op === "get") {
+    const found = parents.map((p) => p[last]);
+    results.push(selector === null ? found[0] : found);
+  } else if (op === "set") {
+    for (const p of parents) p[last] = value;
+  } else {
+    const called = parents.map((p) => p[last](...value));
+    results.push(selector === null ? called[0] : called);
+  }
+}
+return JSON.stringify(results);
+"""
+_batch_runner = None
+
+
+class BatchValue:
+    """
+    The result of a read recorded in a `Batch`, available as `value` once
+    the batch has run.
+    """
+
+    def __init__(self):
+        self._ready = False
+        self._value = None
+
+    @property
+    def value(self):
+        if not self._ready:
+            raise RuntimeError("The batch has not run yet.")
+        return self._value
+
+
+class Batch:
+    """
+    Records DOM reads, writes and method calls, then runs them all at once
+    on the main thread. Created via `batch()`.
+
+    Each operation names a `target` (a JavaScript object, or `None` for
+    `document`), an optional CSS `selector` (to apply the operation to every
+    matching element within the target) and a dotted property `path`.
+    Values read, written and passed to methods must be JSON compatible.
+    """
+
+    def __init__(self):
+        self._ops = []
+        self._targets = []
+        self._values = []
+
+    def _record(self, op, target, selector, path, value=None):
+        index = -1
+        if target is not None:
+            index = len(self._targets)
+            self._targets.append(target)
+        self._ops.append([op, index, selector, path, value])
+        if op == "set":
+            return None
+        result = BatchValue()
+        self._values.append(result)
+        return result
+
+    def get(self, target, path, selector=None):
+        """
+        Read the property at `path` of `target` (or of every element
+        matching `selector` within it, giving a list). Returns a
+        `BatchValue`.
+        """
+        return self._record("get", target, selector, path)
+
+    def set(self, target, path, value, selector=None):
+        """
+        Set the property at `path` of `target` (or of every element
+        matching `selector` within it) to `value`.
+        """
+        self._record("set", target, selector, path, value)
+
+    def call(self, target, path, *args, selector=None):
+        """
+        Call the method at `path` of `target` (or of every element matching
+        `selector` within it) with `args`. Returns a `BatchValue`.
+        """
+        return self._record("call", target, selector, path, list(args))
+
+    def run(self):
+        """
+        Run the recorded operations, as a single call to the main thread,
+        and fill in the results. Called at the end of the `with` block.
+        """
+        global _batch_runner
+        if not self._ops:
+            return
+        from pyscript.context import window
+
+        if _batch_runner is None:
+            runner = window.Function.new("ops", "...targets", _BATCH_RUNNER)
+            _batch_runner = runner
+        results = json.loads(_batch_runner(json.dumps(self._ops), *self._targets))
+        for batch_value, result in zip(self._values, results):
+            batch_value._value = result
+            batch_value._ready = True
+        self._ops = []
+        self._targets = []
+        self._values = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.run()
+
+    def __call__(self, func):
+        """
+        Decorate `func` so each call gets a new `Batch` as its first
+        argument, which is run when the call returns. This instance is only
+        used as the decorator.
+        """
+        from pyscript.util import is_awaitable
+
+        if is_awaitable(func):
+
+            async def batched(*args, **kwargs):
+                with Batch() as b:
+                    return await func(b, *args, **kwargs)
+
+        else:
+
+            def batched(*args, **kwargs):
+                with Batch() as b:
+                    return func(b, *args, **kwargs)
+
+        return batched
+
+
+def batch(func=None):
+    """
+    Return a `Batch` to record DOM reads, writes and method calls, which
+    are all run together at the end of the `with` block. It can also be
+    used as a decorator (see below).
+
+    In a worker, every access to `window` or `document` is a separate,
+    synchronous round trip to the main thread. A batch needs only one,
+    however many operations it holds. (On the main thread a batch still
+    works, but saves little.)
+
+    ```python
+    from pyscript import document, ffi
+
+
+    with ffi.batch() as b:
+        # Read the value of every input in a form.
+        values = b.get(None, "value", selector="#signup input")
+        title = b.get(None, "title")
+        # Update many elements at once.
+        b.set(None, "className", "done", selector=".task")
+        b.call(None, "classList.add", "highlight", selector=".new")
+        b.set(None, "textContent", "Saved!", selector="#status")
+
+    print(values.value, title.value)
+    ```
+
+    Use `None` as the target for `document`. Only JSON compatible values
+    can be read, written or passed to methods.
+
+    As a decorator (with or without brackets), each call of the decorated
+    function is given a new batch as its first argument, and the batch is
+    run when the function returns (so `BatchValue` results are only ready
+    after the call):
+
+    ```python
+    from pyscript import ffi
+
+
+    @ffi.batch
+    def mark_done(b, selector):
+        b.set(None, "className", "done", selector=selector)
+        b.set(None, "textContent", "Saved!", selector="#status")
+
+
+    mark_done(".task")
+    ```
+    """
+    if func is not None:
+        return Batch()(func)
+    return Batch()
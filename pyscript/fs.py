@@ -11,6 +11,15 @@ running in the browser, can read and write files on the user's local machine.
 The module maintains a `mounted` dictionary that tracks all currently mounted
 paths and their associated filesystem handles.
 
+Synchronisation is incremental: files written (or removed) through the
+virtual filesystem since the last sync are detected and only those are
+copied to the local directory. A full, two-way reconciliation is still
+available via `sync(path, full=True)`.
+
+Very large files in a mounted directory can be read and written in
+fixed-size chunks, straight from and to the local filesystem, with
+`open_stream()`.
+
 ```python
 from pyscript import fs, document, when
 
@@ -30,18 +39,24 @@ async def handler(event):
 with open("/local/example.txt", "w") as f:
     f.write("Hello from PyScript!")
 
-# Ensure changes are written to local filesystem.
-await fs.sync("/local")
+# Ensure changes are written to local filesystem. Only the files that
+# changed are written, and a report of what was touched is returned.
+report = await fs.sync("/local")
+print(report["files"], report["bytes"])
 
 # Clean up when done.
 await fs.unmount("/local")
 ```
 """
 
+import asyncio
+import os
+import time
+
 import js
 from _pyscript import fs as _fs, interpreter
 from pyscript import window
-from pyscript.ffi import to_js
+from pyscript.ffi import from_typed_array, is_none, to_js, to_typed_array
 from pyscript.context import RUNNING_IN_WORKER
 
 # Worker-specific imports.
@@ -52,6 +67,114 @@ if RUNNING_IN_WORKER:
 mounted = {}
 """Global dictionary tracking mounted paths and their filesystem handles."""
 
+# The local directory handle for each mounted path.
+_handles = {}
+# The (mtime, size, synced) of each file under a mounted path, as of the last
+# sync, where `synced` is the (whole) second the file was last synced.
+_snapshots = {}
+# Running auto-sync tasks, keyed by mounted path.
+_auto_syncs = {}
+
+
+def _is_dir(mode):
+    """
+    Return True if the `mode` from an `os.stat` result is a directory.
+    """
+    return mode & 0o170000 == 0o040000
+
+
+def _scan(path, prefix="", result=None):
+    """
+    Return a dictionary mapping each file under `path` (as a path relative
+    to it) to its `(mtime, size)`.
+
+    This only touches the in-memory virtual filesystem, so is cheap compared
+    to enumerating the local directory through its handles.
+    """
+    if result is None:
+        result = {}
+    for name in os.listdir(path):
+        full = f"{path}/{name}"
+        relative = f"{prefix}{name}"
+        info = os.stat(full)
+        if _is_dir(info[0]):
+            _scan(full, f"{relative}/", result)
+        else:
+            result[relative] = (info[8], info[6])
+    return result
+
+
+def _snapshot(scan, synced):
+    """
+    Return the snapshot of the files in `scan` (from `_scan`), synced in
+    the (whole) second `synced`.
+    """
+    return {name: stat + (synced,) for name, stat in scan.items()}
+
+
+def dirty(path):
+    """
+    Return a sorted list of the files under the mounted `path` (relative to
+    it) that have been written or removed since the last sync.
+
+    ```python
+    from pyscript import fs
+
+
+    await fs.mount("/local")
+    with open("/local/notes.txt", "w") as f:
+        f.write("Hello")
+
+    print(fs.dirty("/local"))  # ["notes.txt"]
+    ```
+    """
+    if path not in mounted:
+        raise KeyError(
+            f"Path '{path}' is not mounted. " f"Use fs.mount() to mount it first."
+        )
+    before = _snapshots.get(path, {})
+    now = _scan(path)
+    changed = []
+    for name, stat in now.items():
+        seen = before.get(name)
+        # Modification times are whole seconds, so a file written in the
+        # same second it was synced may look unchanged: treat it as dirty
+        # until a sync in a later second.
+        if seen is None or seen[:2] != stat or stat[0] >= seen[2]:
+            changed.append(name)
+    changed.extend(name for name in before if name not in now)
+    return sorted(changed)
+
+
+async def _local_handle(directory, relative, create=False, is_file=True):
+    """
+    Walk from the `directory` handle to the handle for the `relative` path,
+    optionally creating missing directories and the file itself. Returns
+    the handle of the parent directory and the final name when `is_file` is
+    False, so the entry can be removed.
+    """
+    options = to_js({"create": create})
+    parts = relative.split("/")
+    for part in parts[:-1]:
+        directory = await directory.getDirectoryHandle(part, options)
+    if is_file:
+        return await directory.getFileHandle(parts[-1], options)
+    return directory, parts[-1]
+
+
+async def _remove_local(directory, relative):
+    """
+    Remove the file at the `relative` path below the `directory` handle
+    from the local filesystem, if it's still there.
+    """
+    try:
+        parent, entry = await _local_handle(directory, relative, is_file=False)
+        await parent.removeEntry(entry)
+    except Exception as error:
+        # Already gone (perhaps with its directory) from the local filesystem.
+        if "NotFoundError" not in str(error):
+            raise
+
 
 async def _check_permission(details):
     """
@@ -64,6 +187,148 @@ async def _check_permission(details):
     return handler if permission == "granted" else None
 
 
+# Mount key ("path@id") -> directory handle with granted permission, cached
+# for the lifetime of this interpreter. Each worker has its own: the main
+# thread side of a worker's mount is handled by polyscript, in JavaScript.
+_granted = {}
+# Mounted path -> the mount key it was mounted with.
+_mount_keys = {}
+# The IndexedDB map of stored handles, opened once per worker.
+_idb = None
+
+mount_times = {}
+"""
+Timings (in milliseconds) for the most recent mount of each path, keyed by
+mount path: `lookup_ms` (finding a stored handle), `permission_ms`
+(checking, or asking for, permission), `mount_ms` (mounting into the
+virtual filesystem) and `total_ms`, plus whether the handle was `cached`.
+"""
+
+
+def _mount_options(path, mode, root, id):
+    """
+    Validate a mount and return its key and directory picker options.
+    """
+    mount_key = f"{path}@{id}"
+    if path in mounted and _mount_keys.get(path) != mount_key:
+        raise ValueError(
+            f"Path '{path}' is already mounted with a different ID. "
+            f"Unmount it first or use a different path."
+        )
+    options = {"id": id, "mode": mode}
+    if root != "":
+        options["startIn"] = root
+    return mount_key, options
+
+
+async def _store_in_worker(mount_key, options):
+    """
+    Ask the main thread to make sure a handler for `mount_key` is stored,
+    prompting the user for a directory if needed.
+    """
+    fs_handler = sync_with_worker.storeFSHandler(mount_key, to_js(options))
+
+    # Handle both async and SharedArrayBuffer use cases.
+    if isinstance(fs_handler, bool):
+        success = fs_handler
+    else:
+        success = await fs_handler
+
+    if not success:
+        raise RuntimeError(_fs.ERROR)
+
+
+def _stored_handlers():
+    """
+    Return the IndexedDB map of stored handlers (opened once per worker).
+    """
+    global _idb
+    if not RUNNING_IN_WORKER:
+        return _fs.idb
+    if _idb is None:
+        _idb = IDBMap.new(_fs.NAMESPACE)
+    return _idb
+
+
+async def _lookup(mount_key, options):
+    """
+    Return the stored details (handler and options) for `mount_key`, or
+    None if the user has not picked a directory for it yet.
+    """
+    if RUNNING_IN_WORKER:
+        # The main thread prompts for, and stores, the handler if needed.
+        await _store_in_worker(mount_key, options)
+    details = await _stored_handlers().get(mount_key)
+    return None if is_none(details) else details
+
+
+async def _lookup_many(mount_keys):
+    """
+    Return a dict of the stored details for those of `mount_keys` that have
+    them, read from IndexedDB in a single transaction.
+    """
+    wanted = set(mount_keys)
+    found = {}
+    if not wanted:
+        return found
+    for entry in await _stored_handlers().entries():
+        if entry[0] in wanted and not is_none(entry[1]):
+            found[entry[0]] = entry[1]
+    return found
+
+
+async def _resolve(mount_key, options, timings):
+    """
+    Return a directory handle, with permission granted, for `mount_key`,
+    prompting the user if needed. Phase timings are added to `timings`.
+    """
+    start = js.performance.now()
+    handler = _granted.get(mount_key)
+    timings["cached"] = handler is not None
+    if handler is not None:
+        timings["lookup_ms"] = js.performance.now() - start
+        timings["permission_ms"] = 0
+        return handler
+
+    details = await _lookup(mount_key, options)
+    checked = js.performance.now()
+    timings["lookup_ms"] = checked - start
+
+    if details is not None:
+        handler = await _check_permission(details)
+        if handler is None:
+            if RUNNING_IN_WORKER:
+                # Force await in either async or sync scenario.
+                await js.Promise.resolve(
+                    sync_with_worker.getFSHandler(details.options)
+                )
+                handler = details.handler
+            else:
+                handler = await _fs.getFileSystemDirectoryHandle(details.options)
+    else:
+        js_options = to_js(options)
+        handler = await _fs.getFileSystemDirectoryHandle(js_options)
+        details = {"handler": handler, "options": js_options}
+        await _fs.idb.set(mount_key, to_js(details))
+
+    timings["permission_ms"] = js.performance.now() - checked
+    _granted[mount_key] = handler
+    return handler
+
+
+async def _mount_handler(path, mount_key, handler, timings):
+    """
+    Mount the directory `handler` at `path` in the virtual filesystem.
+    """
+    start = js.performance.now()
+    mounted[path] = await interpreter.mountNativeFS(path, handler)
+    _mount_keys[path] = mount_key
+    _handles[path] = handler
+    synced = int(time.time())
+    _snapshots[path] = _snapshot(_scan(path), synced)
+    timings["mount_ms"] = js.performance.now() - start
+
+
 async def mount(path, mode="readwrite", root="", id="pyscript"):
     """
     Mount a directory from the local filesystem to the virtual filesystem
@@ -94,70 +359,124 @@ async def mount(path, mode="readwrite", root="", id="pyscript"):
 
     If called during a user interaction (like a button click), the
     permission dialog may be skipped if permission was previously granted.
+
+    Handles and granted permissions are cached in memory, so mounting the
+    same `path` and `id` again (e.g. after `unmount()`) skips the IndexedDB
+    lookup and permission check. How long each phase took is recorded in
+    `mount_times[path]`.
     """
     js.console.warn("experimental pyscript.fs ⚠️")
 
-    # Check if path is already mounted with a different ID.
-    mount_key = f"{path}@{id}"
-    if path in mounted:
-        # Path already mounted - check if it's the same ID.
-        for existing_key in mounted.keys():
-            if existing_key.startswith(f"{path}@") and existing_key != mount_key:
-                raise ValueError(
-                    f"Path '{path}' is already mounted with a different ID. "
-                    f"Unmount it first or use a different path."
-                )
+    start = js.performance.now()
+    mount_key, options = _mount_options(path, mode, root, id)
+    timings = {}
+    handler = await _resolve(mount_key, options, timings)
+    await _mount_handler(path, mount_key, handler, timings)
+    timings["total_ms"] = js.performance.now() - start
+    mount_times[path] = timings
 
-    details = None
-    handler = None
 
-    options = {"id": id, "mode": mode}
-    if root != "":
-        options["startIn"] = root
-
-    if RUNNING_IN_WORKER:
-        fs_handler = sync_with_worker.storeFSHandler(mount_key, to_js(options))
-
-        # Handle both async and SharedArrayBuffer use cases.
-        if isinstance(fs_handler, bool):
-            success = fs_handler
-        else:
-            success = await fs_handler
+async def mount_many(mounts):
+    """
+    Mount several directories at once. Each item in `mounts` is either a
+    mount `path` or a dictionary of arguments for `mount()`.
 
-        if success:
-            idbm = IDBMap.new(_fs.NAMESPACE)
-            details = await idbm.get(mount_key)
-            handler = await _check_permission(details)
-            if handler is None:
-                # Force await in either async or sync scenario.
-                await js.Promise.resolve(sync_with_worker.getFSHandler(details.options))
-                handler = details.handler
-        else:
-            raise RuntimeError(_fs.ERROR)
+    Stored handles for all the mounts are read from IndexedDB in a single
+    transaction, and their permissions checked together, rather than one
+    mount at a time. The user is only
+    prompted for the mounts that have no stored handle with granted
+    permission (browsers require a separate directory picker for each of
+    those).
 
-    else:
-        success = await _fs.idb.has(mount_key)
+    ```python
+    from pyscript import fs
 
-        if success:
-            details = await _fs.idb.get(mount_key)
-            handler = await _check_permission(details)
-            if handler is None:
-                handler = await _fs.getFileSystemDirectoryHandle(details.options)
-        else:
-            js_options = to_js(options)
-            handler = await _fs.getFileSystemDirectoryHandle(js_options)
-            details = {"handler": handler, "options": js_options}
-            await _fs.idb.set(mount_key, to_js(details))
 
-    mounted[path] = await interpreter.mountNativeFS(path, handler)
+    await fs.mount_many([
+        "/data",
+        {"path": "/models", "mode": "read", "id": "models"},
+    ])
+    ```
 
+    Timings for each mount are recorded in `mount_times`.
+    """
+    js.console.warn("experimental pyscript.fs ⚠️")
 
-async def sync(path):
+    start = js.performance.now()
+    pending = []
+    for item in mounts:
+        if isinstance(item, str):
+            item = {"path": item}
+        path = item["path"]
+        mount_key, options = _mount_options(
+            path,
+            item.get("mode", "readwrite"),
+            item.get("root", ""),
+            item.get("id", "pyscript"),
+        )
+        pending.append((path, mount_key, options, {}))
+
+    # Look up all the stored handles in one IndexedDB transaction, then
+    # check their permissions together. Anything that needs the user's
+    # attention is then prompted for one at a time.
+    begin = js.performance.now()
+    wanted = []
+    for _, mount_key, options, timings in pending:
+        timings["cached"] = mount_key in _granted
+        timings["lookup_ms"] = 0
+        timings["permission_ms"] = 0
+        if not timings["cached"]:
+            wanted.append(mount_key)
+            if RUNNING_IN_WORKER:
+                # The main thread may need to show a picker, and only one
+                # can be shown at a time.
+                await _store_in_worker(mount_key, options)
+    stored = await _lookup_many(wanted)
+    checked = js.performance.now()
+
+    async def check_stored(mount_key, timings):
+        timings["lookup_ms"] = checked - begin
+        details = stored.get(mount_key)
+        if details is not None and await _check_permission(details) is not None:
+            _granted[mount_key] = details.handler
+        timings["permission_ms"] = js.performance.now() - checked
+
+    await asyncio.gather(
+        *[
+            check_stored(mount_key, timings)
+            for _, mount_key, _, timings in pending
+            if not timings["cached"]
+        ]
+    )
+
+    for path, mount_key, options, timings in pending:
+        handler = _granted.get(mount_key)
+        if handler is None:
+            handler = await _resolve(mount_key, options, timings)
+        await _mount_handler(path, mount_key, handler, timings)
+        timings["total_ms"] = js.performance.now() - start
+        mount_times[path] = timings
+
+
+async def sync(path, files=None, full=False):
     """
     Synchronise the virtual and local filesystems for a mounted `path`.
 
-    This ensures all changes made in the browser's virtual filesystem are
-    written to the user's local filesystem, and vice versa.
+    By default only the files written or removed through the virtual
+    filesystem since the last sync (see `dirty()`) are copied to the user's
+    local filesystem. Pass a list of `files` (relative to `path`) to sync
+    just those, or `full=True` to reconcile the whole directory in both
+    directions (which also picks up changes made on the local filesystem,
+    but is slow for large directories).
+
+    Returns a dictionary reporting how many `files` and `bytes` were
+    written, how many files were `deleted`, the files that `failed` to sync
+    (mapped to the error, and left dirty so the next sync tries them
+    again), and how long the sync took in milliseconds (`ms`).
+
+    Before incremental syncing, every call reconciled the whole directory,
+    as `full=True` still does. Changes made to the local folder outside
+    the browser are only picked up with `full=True`.
 
     ```python
     from pyscript import fs
@@ -170,7 +489,14 @@ async def sync(path):
         f.write("Important data")
 
     # Ensure changes are written to local disk.
-    await fs.sync("/local")
+    report = await fs.sync("/local")
+    print(report)  # {"files": 1, "bytes": 14, "deleted": 0, "failed": {}, "ms": 3.2}
+
+    # Sync a single file.
+    await fs.sync("/local", files=["data.txt"])
+
+    # Reconcile everything, in both directions.
+    await fs.sync("/local", full=True)
     ```
 
     This is automatically called by unmount(), but you may want to call
@@ -180,7 +506,127 @@ async def sync(path):
         raise KeyError(
             f"Path '{path}' is not mounted. " f"Use fs.mount() to mount it first."
         )
-    await mounted[path].syncfs()
+    start = js.performance.now()
+    synced = int(time.time())
+    now = _scan(path)
+    if full:
+        await mounted[path].syncfs()
+        # Changes may have come in from the local filesystem too.
+        now = _scan(path)
+        _snapshots[path] = _snapshot(now, synced)
+        return {
+            "files": len(now),
+            "bytes": sum(size for _, size in now.values()),
+            "deleted": 0,
+            "failed": {},
+            "ms": js.performance.now() - start,
+        }
+
+    if files is None:
+        files = dirty(path)
+    snapshot = _snapshots.setdefault(path, {})
+    directory = _handles[path]
+    written = 0
+    total = 0
+    deleted = 0
+    failed = {}
+    for name in files:
+        name = name.strip("/")
+        # A file that can't be synced is reported and left dirty, so the
+        # rest still get synced and it's tried again next time.
+        try:
+            if name in now:
+                with open(f"{path}/{name}", "rb") as f:
+                    data = f.read()
+                handle = await _local_handle(directory, name, create=True)
+                writable = await handle.createWritable()
+                await writable.write(to_typed_array(data))
+                await writable.close()
+                snapshot[name] = now[name] + (synced,)
+                written += 1
+                total += len(data)
+            elif name in snapshot:
+                await _remove_local(directory, name)
+                del snapshot[name]
+                deleted += 1
+        except Exception as error:
+            failed[name] = str(error)
+    return {
+        "files": written,
+        "bytes": total,
+        "deleted": deleted,
+        "failed": failed,
+        "ms": js.performance.now() - start,
+    }
+
+
+async def _auto_sync(path, interval):
+    """
+    Sync `path` every `interval` seconds, but only once its dirty files have
+    stopped changing (so a burst of writes results in a single sync).
+    """
+    pending = None
+    while path in mounted:
+        await asyncio.sleep(interval)
+        if path not in mounted:
+            break
+        changed = dirty(path)
+        if not changed:
+            pending = None
+            continue
+        # Take a fingerprint of the dirty files, and only sync once it has
+        # been stable for a whole interval.
+        current = _scan(path)
+        fingerprint = [(name, current.get(name)) for name in changed]
+        if fingerprint == pending:
+            await sync(path, files=changed)
+            pending = None
+        else:
+            pending = fingerprint
+
+
+def auto_sync(path, interval=2.0):
+    """
+    Automatically sync the mounted `path` every `interval` seconds. Syncing
+    is debounced: a sync only happens once the dirty files have stayed
+    unchanged for a whole `interval`, so a burst of writes is written to the
+    local filesystem once. Pass `interval=None` to stop auto-syncing.
+
+    ```python
+    from pyscript import fs
+
+
+    await fs.mount("/local")
+    fs.auto_sync("/local", interval=5)
+
+    # Later...
+    fs.auto_sync("/local", None)
+    ```
+
+    Auto-syncing stops when the path is unmounted.
+    """
+    if path not in mounted:
+        raise KeyError(
+            f"Path '{path}' is not mounted. " f"Use fs.mount() to mount it first."
+        )
+    task = _auto_syncs.pop(path, None)
+    if task:
+        task.cancel()
+    if interval is not None:
+        _auto_syncs[path] = asyncio.create_task(_auto_sync(path, interval))
+
+
+def _forget(path):
+    """
+    Drop all the state kept for the mounted `path`.
+    """
+    mounted.pop(path, None)
+    _mount_keys.pop(path, None)
+    _handles.pop(path, None)
+    _snapshots.pop(path, None)
+    task = _auto_syncs.pop(path, None)
+    if task:
+        task.cancel()
 
 
 async def unmount(path):
@@ -211,7 +657,7 @@ async def unmount(path):
 
     await sync(path)
     interpreter._module.FS.unmount(path)
-    del mounted[path]
+    _forget(path)
 
 
 async def revoke(path, id="pyscript"):
@@ -242,6 +688,7 @@ async def revoke(path, id="pyscript"):
     select a directory when `mount()` is called next time.
     """
     mount_key = f"{path}@{id}"
+    _granted.pop(mount_key, None)
 
     if RUNNING_IN_WORKER:
         handler_exists = sync_with_worker.deleteFSHandler(mount_key)
@@ -252,7 +699,188 @@ async def revoke(path, id="pyscript"):
 
     if handler_exists:
         interpreter._module.FS.unmount(path)
-        if path in mounted:
-            del mounted[path]
+        _forget(path)
 
     return handler_exists
+
+
+def _locate(path):
+    """
+    Return the local directory handle and relative path for a `path` inside
+    a mounted directory.
+    """
+    best = None
+    for mount_point in _handles:
+        prefix = mount_point.rstrip("/") + "/"
+        if path.startswith(prefix):
+            if best is None or len(mount_point) > len(best):
+                best = mount_point
+    if best is None:
+        raise KeyError(
+            f"Path '{path}' is not inside a mounted directory. "
+            f"Use fs.mount() to mount it first."
+        )
+    return _handles[best], path[len(best.rstrip("/")) + 1 :]
+
+
+class FileStream:
+    """
+    A binary file-like object that reads from, or writes to, a file on the
+    user's local filesystem in chunks of `chunk_size` bytes. Use
+    `open_stream()` to create one.
+
+    All methods are coroutines, and the stream is also an asynchronous
+    iterator (yielding `bytes` chunks) and an asynchronous context manager.
+    """
+
+    def __init__(self, handle, mode, chunk_size):
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self.closed = False
+        self.size = None
+        self._handle = handle
+        self._position = 0
+        self._buffer = bytearray()
+        self._reader = None
+        self._writable = None
+        self._eof = False
+
+    async def _open(self):
+        """
+        Get hold of the underlying JavaScript stream.
+        """
+        if self.mode == "rb":
+            file = await self._handle.getFile()
+            self.size = file.size
+            self._reader = file.stream().getReader()
+        else:
+            append = self.mode == "ab"
+            self._writable = await self._handle.createWritable(
+                to_js({"keepExistingData": append})
+            )
+            if append:
+                file = await self._handle.getFile()
+                self._position = file.size
+                await self._writable.seek(self._position)
+
+    def readable(self):
+        return self.mode == "rb"
+
+    def writable(self):
+        return self.mode != "rb"
+
+    def tell(self):
+        """
+        Return the current position in the file.
+        """
+        return self._position
+
+    async def read(self, size=-1):
+        """
+        Read and return up to `size` bytes (or everything that remains, if
+        `size` is negative). Returns empty `bytes` at the end of the file.
+        """
+        if not self.readable():
+            raise OSError("Stream not open for reading.")
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            result = await self._reader.read()
+            if result.done:
+                self._eof = True
+            else:
+                self._buffer.extend(from_typed_array(result.value))
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer = bytearray()
+        else:
+            data = bytes(self._buffer[:size])
+            self._buffer = self._buffer[size:]
+        self._position += len(data)
+        return data
+
+    async def write(self, data):
+        """
+        Write the bytes-like `data`, returning the number of bytes written.
+        Data is sent to the local file in chunks of `chunk_size` bytes.
+        """
+        if not self.writable():
+            raise OSError("Stream not open for writing.")
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.chunk_size:
+            chunk = self._buffer[: self.chunk_size]
+            self._buffer = self._buffer[self.chunk_size :]
+            await self._writable.write(to_typed_array(chunk))
+        self._position += len(data)
+        return len(data)
+
+    async def close(self):
+        """
+        Flush any buffered data and close the stream. For writes, the
+        local file is only updated once the stream is closed.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self._writable:
+            if self._buffer:
+                await self._writable.write(to_typed_array(self._buffer))
+            await self._writable.close()
+        elif self._reader:
+            await self._reader.cancel()
+        self._buffer = bytearray()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = await self.read(self.chunk_size)
+        if not chunk:
+            raise StopAsyncIteration
+        return chunk
+
+
+async def open_stream(path, mode="rb", chunk_size=1024 * 1024):
+    """
+    Open the file at `path`, inside a mounted directory, for streaming
+    reads or writes directly against the user's local filesystem. The
+    `mode` is one of `"rb"`, `"wb"` or `"ab"`, and data is read and written
+    in chunks of `chunk_size` bytes, so memory use stays bounded however
+    large the file is.
+
+    Returns a `FileStream`, whose methods are coroutines.
+
+    ```python
+    from pyscript import fs
+
+
+    await fs.mount("/local")
+
+    # Process a huge file one chunk at a time.
+    total = 0
+    async with await fs.open_stream("/local/huge.bin") as stream:
+        async for chunk in stream:
+            total += len(chunk)
+
+    # Write a file chunk by chunk.
+    async with await fs.open_stream("/local/out.bin", "wb") as stream:
+        for i in range(1000):
+            await stream.write(bytes(4096))
+    ```
+
+    Streams bypass the virtual filesystem: they read what is on the local
+    filesystem (so call `sync()` first if you have just written the file
+    with `open()`), and data written through them only appears under the
+    mount point after `sync(path, full=True)`.
+    """
+    if mode not in ("rb", "wb", "ab"):
+        raise ValueError(f"Invalid mode '{mode}'. Use 'rb', 'wb' or 'ab'.")
+    directory, relative = _locate(path)
+    handle = await _local_handle(directory, relative, create=mode != "rb")
+    stream = FileStream(handle, mode, chunk_size)
+    await stream._open()
+    return stream
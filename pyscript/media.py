@@ -10,6 +10,8 @@ Use this module for:
 - Recording audio from microphones.
 - Enumerating available media devices.
 - Applying constraints to media streams (resolution, frame rate, etc.).
+- Streaming video frames to a worker for processing off the main thread.
+- Processing microphone audio in fixed-size blocks of samples.
 
 ```python
 from pyscript import document
@@ -31,10 +33,85 @@ for device in devices:
 
 Using media devices requires user permission. Browsers will show a
 permission dialog when accessing devices for the first time.
+
+The list of devices is cached, and kept up to date as devices are plugged in
+and removed. Streams are shared: asking again for a stream with the same
+constraints returns the same live stream. Call `release_stream()` when you're
+done with one, and its tracks are stopped once nobody else is using it.
 """
 
-from pyscript import window
-from pyscript.ffi import to_js
+import asyncio
+import json
+
+import js
+from pyscript import document, window
+from pyscript.ffi import _create_proxy, from_typed_array, to_js
+
+
+# Device key -> Device, in the order the browser lists them.
+_devices = {}
+_devices_stale = True
+_listening = False
+# Stream constraints (as JSON) -> [stream, reference count].
+_streams = {}
+
+
+def _on_device_change(event):
+    global _devices_stale
+    _devices_stale = True
+    asyncio.create_task(_refresh_devices())
+
+
+async def _refresh_devices():
+    """
+    Update the cached devices from the browser, reusing the `Device` for
+    each device that's still present.
+    """
+    global _devices, _devices_stale, _listening
+    media_devices = window.navigator.mediaDevices
+    if not _listening:
+        _listening = True
+        media_devices.addEventListener(
+            "devicechange", _create_proxy(_on_device_change)
+        )
+    _devices_stale = False
+    devices = {}
+    for index, device_info in enumerate(await media_devices.enumerateDevices()):
+        # Device IDs are empty until permission is granted.
+        key = f"{device_info.kind}:{device_info.deviceId or index}"
+        device = _devices.get(key)
+        if device is None:
+            device = Device(device_info)
+        else:
+            device._device_info = device_info
+        devices[key] = device
+    _devices = devices
+
+
+def release_stream(stream):
+    """
+    Release a `stream` returned by `Device.request_stream()` or
+    `Device.get_stream()`. Once every user of the stream has released it,
+    its tracks are stopped, freeing the camera or microphone.
+
+    ```python
+    from pyscript.media import Device, release_stream
+
+
+    stream = await Device.request_stream(video=True)
+    # ... use it ...
+    release_stream(stream)
+    ```
+    """
+    for key, shared in list(_streams.items()):
+        if shared[0].id == stream.id:
+            shared[1] -= 1
+            if shared[1] > 0:
+                return
+            del _streams[key]
+            break
+    for track in stream.getTracks():
+        track.stop()
 
 
 class Device:
@@ -153,7 +230,13 @@ class Device:
         ```
 
         This method will trigger a browser permission dialog on first use.
+
+        If a stream with the same constraints is already live, it is
+        returned (and its reference count increased) instead of requesting
+        a new one. Pass the stream to `release_stream()`, rather than
+        stopping its tracks, when you no longer need it.
         """
+        global _devices_stale
         options = {}
         if isinstance(audio, bool):
             options["audio"] = audio
@@ -165,7 +248,18 @@ class Device:
         elif isinstance(video, dict):
             # video is a dict of constraints (width, height etc...).
             options["video"] = video
-        return await window.navigator.mediaDevices.getUserMedia(to_js(options))
+        key = json.dumps(options)
+        shared = _streams.get(key)
+        if shared and all(
+            track.readyState == "live" for track in shared[0].getTracks()
+        ):
+            shared[1] += 1
+            return shared[0]
+        stream = await window.navigator.mediaDevices.getUserMedia(to_js(options))
+        _streams[key] = [stream, 1]
+        # Permission may have been granted, which reveals device labels.
+        _devices_stale = True
+        return stream
 
     @classmethod
     async def load(cls, audio=False, video=True):
@@ -242,6 +336,296 @@ async def list_devices():
     permission is granted. See
     [this document](https://developer.mozilla.org/en-US/docs/Web/API/MediaDevices/enumerateDevices)
     for more information about this web standard.
+
+    The list is cached, and updated when the browser reports that devices
+    have changed, so calling this often is cheap. The same `Device` object
+    is returned for a device each time.
+    """
+    if _devices_stale:
+        await _refresh_devices()
+    return list(_devices.values())
+
+
+async def stream_to_worker(stream, worker, key="video"):
+    """
+    Stream the video frames of a `MediaStream` to the named `worker`, where
+    `pyscript.workers.frames(key)` iterates over them. Drawing and analysis
+    can then happen entirely off the main thread. Returns a function to call
+    to stop streaming.
+
+    ```python
+    from pyscript import workers
+    from pyscript.media import Device, stream_to_worker
+
+
+    stream = await Device.request_stream(video=True)
+    await workers["vision"]
+    stop = await stream_to_worker(stream, "vision", key="camera")
+
+    # Later.
+    stop()
+    ```
+
+    Where the browser supports it, the frames travel as `VideoFrame`
+    objects over a `ReadableStream` handed to the worker once, so the main
+    thread is not involved per frame. Otherwise, each frame is captured on
+    the main thread as an `ImageBitmap` and transferred (not copied) to the
+    worker.
+    """
+    from pyscript.workers import transfer
+
+    # Use a clone of the track, so stopping only affects this stream.
+    track = stream.getVideoTracks()[0].clone()
+    if hasattr(window, "MediaStreamTrackProcessor"):
+        processor = window.MediaStreamTrackProcessor.new(to_js({"track": track}))
+        transfer(worker, key, processor.readable)
+        return track.stop
+
+    from pyscript.web import video
+
+    element = document.createElement("video")
+    element.muted = True
+    element.playsInline = True
+    element.srcObject = window.MediaStream.new(to_js([track]))
+    await element.play()
+    captured = video(dom_element=element).frames(format="bitmap")
+
+    async def send():
+        async for bitmap in captured:
+            transfer(worker, key, bitmap)
+        transfer(worker, key, None)
+
+    task = asyncio.create_task(send())
+
+    def stop():
+        if not task.done():
+            captured.stop()
+        track.stop()
+
+    return stop
+
+
+# The AudioWorklet that taps the audio stream. With shared memory it writes
+# float32 samples into a `pyscript.shared.RingBuffer` (and posts a message
+# for each overrun), otherwise it posts blocks of samples as messages.
+_AUDIO_TAP = """
+class PyScriptAudioTap extends AudioWorkletProcessor {
+  constructor(options) {
+    super();
+    const { buffer, blockSize } = options.processorOptions;
+    this.blockSize = blockSize;
+    this.running = true;
+    this.port.onmessage = () => { this.running = false; };
+    if (buffer) {
+      this.positions = new Int32Array(buffer, 0, 2);
+      this.data = new Uint8Array(buffer, 8);
+    } else {
+      this.block = new Float32Array(blockSize);
+      this.filled = 0;
+    }
+  }
+  process(inputs) {
+    const samples = inputs[0] && inputs[0][0];
+    if (samples) {
+      if (this.data) this.write(samples);
+      else this.collect(samples);
+    }
+    return this.running;
+  }
+  write(samples) {
+    const bytes = new Uint8Array(
+      samples.buffer, samples.byteOffset, samples.byteLength
+    );
+    const size = this.data.length;
+    const head = Atomics.load(this.positions, 0);
+    const tail = Atomics.load(this.positions, 1);
+    if (bytes.length > size - 1 - ((tail - head + size) % size)) {
+      this.port.postMessage(null);
+      return;
+    }
+    const first = Math.min(bytes.length, size - tail);
+    this.data.set(bytes.subarray(0, first), tail);
+    if (first < bytes.length) this.data.set(bytes.subarray(first), 0);
+    Atomics.store(this.positions, 1, (tail + bytes.length) % size);
+    Atomics.notify(this.positions, 1);
+  }
+  collect(samples) {
+    let offset = 0;
+    while (offset < samples.length) {
+      const count = Math.min(
+        samples.length - offset, this.blockSize - this.filled
+      );
+      this.block.set(samples.subarray(offset, offset + count), this.filled);
+      this.filled += count;
+      offset += count;
+      if (this.filled === this.blockSize) {
+        this.port.postMessage(this.block, [this.block.buffer]);
+        this.block = new Float32Array(this.blockSize);
+        this.filled = 0;
+      }
+    }
+  }
+}
+registerProcessor("pyscript-audio-tap", PyScriptAudioTap);
+"""
+
+
+class AudioBlocks:
+    """
+    An async iterator over fixed-size blocks of audio samples from a
+    `MediaStream`, created via `audio_blocks()`.
+
+    Each block is `block_size` samples (from the first channel) of 32-bit
+    floats between -1 and 1. In Pyodide a block is a `memoryview` of
+    floats, ready for `numpy.asarray`. In MicroPython it's a `memoryview`
+    of the raw bytes.
+
+    Up to `buffered` blocks are held while waiting to be consumed. If the
+    consumer falls further behind, new audio is lost and counted in
+    `overruns`. Latency is reported in seconds: `latency` for the most
+    recent block (the audio queued behind it, plus the audio system's own
+    latency) and `max_latency` overall.
+    """
+
+    def __init__(self, stream, block_size=1024, buffered=8, sample_rate=None):
+        self.stream = stream
+        self.block_size = block_size
+        self.buffered = buffered
+        self.blocks = 0
+        self.overruns = 0
+        self.latency = 0
+        self.max_latency = 0
+        self._options = {"sampleRate": sample_rate} if sample_rate else {}
+        self._ring = None
+        self._queue = []
+        self._ready = asyncio.Event()
+        self._stopped = False
+
+    @property
+    def sample_rate(self):
+        """
+        The number of samples per second.
+        """
+        return self._context.sampleRate
+
+    async def start(self):
+        """
+        Start capturing audio. Called by `audio_blocks()`.
+        """
+        from pyscript.shared import SHARED_MEMORY, RingBuffer
+
+        self._context = window.AudioContext.new(to_js(self._options))
+        blob = js.Blob.new(to_js([_AUDIO_TAP]), to_js({"type": "text/javascript"}))
+        url = js.URL.createObjectURL(blob)
+        await self._context.audioWorklet.addModule(url)
+        js.URL.revokeObjectURL(url)
+        processor_options = {"blockSize": self.block_size, "buffer": None}
+        if SHARED_MEMORY:
+            self._ring = RingBuffer(self.block_size * 4 * self.buffered)
+            processor_options["buffer"] = self._ring.buffer
+        self._node = window.AudioWorkletNode.new(
+            self._context,
+            "pyscript-audio-tap",
+            to_js(
+                {
+                    "numberOfOutputs": 0,
+                    "processorOptions": processor_options,
+                }
+            ),
+        )
+        self._node.port.onmessage = _create_proxy(self._on_message)
+        self._source = self._context.createMediaStreamSource(self.stream)
+        self._source.connect(self._node)
+        return self
+
+    def _on_message(self, event):
+        if self._ring is not None:
+            # With shared memory, messages only report overruns.
+            self.overruns += 1
+            return
+        self._queue.append(event.data)
+        if len(self._queue) > self.buffered:
+            self._queue.pop(0)
+            self.overruns += 1
+        self._ready.set()
+
+    def stop(self):
+        """
+        Stop capturing audio. Iteration ends once the current block has
+        been consumed.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._node.port.postMessage("stop")
+        self._source.disconnect()
+        self._context.close()
+        self._ready.set()
+        if self._ring is not None:
+            js.Atomics.notify(self._ring._positions, 1)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._ring is not None:
+            block = await self._next_shared()
+            queued = len(self._ring) // 4
+        else:
+            while not self._queue:
+                if self._stopped:
+                    raise StopAsyncIteration
+                self._ready.clear()
+                await self._ready.wait()
+            block = from_typed_array(self._queue.pop(0))
+            queued = len(self._queue) * self.block_size
+        self.blocks += 1
+        self.latency = (queued + self.block_size) / self.sample_rate + (
+            self._context.baseLatency or 0
+        )
+        self.max_latency = max(self.max_latency, self.latency)
+        return block
+
+    async def _next_shared(self):
+        from pyscript.shared import _wait_async
+
+        size = self.block_size * 4
+        positions = self._ring._positions
+        while len(self._ring) < size:
+            if self._stopped:
+                raise StopAsyncIteration
+            await _wait_async(positions, 1, js.Atomics.load(positions, 1))
+        block = self._ring.read(size)
+        return block.cast("f") if hasattr(block, "cast") else block
+
+
+async def audio_blocks(stream, block_size=1024, buffered=8, sample_rate=None):
+    """
+    Return an `AudioBlocks` async iterator over blocks of `block_size`
+    audio samples from the first audio channel of `stream` (for example,
+    from `Device.request_stream(audio=True, video=False)`).
+
+    Samples are collected by an
+    [AudioWorklet](https://developer.mozilla.org/en-US/docs/Web/API/AudioWorklet),
+    off the main thread. When shared memory is available (see
+    `pyscript.shared`) they are written straight into a shared ring
+    buffer. Otherwise, they arrive as one message per block. At most
+    `buffered` blocks are held waiting for the consumer. Pass a
+    `sample_rate` to ask for a particular number of samples per second.
+
+    ```python
+    import numpy as np
+    from pyscript.media import Device, audio_blocks
+
+
+    mic = await Device.request_stream(audio=True, video=False)
+    blocks = await audio_blocks(mic, block_size=2048)
+    async for block in blocks:
+        volume = np.sqrt(np.mean(np.asarray(block) ** 2))
+        print(f"{volume:.3f} ({blocks.latency * 1000:.0f}ms latency)")
+    ```
+
+    Call `stop()` on the result to stop capturing.
     """
-    device_infos = await window.navigator.mediaDevices.enumerateDevices()
-    return [Device(device_info) for device_info in device_infos]
+    blocks = AudioBlocks(stream, block_size, buffered, sample_rate)
+    return await blocks.start()
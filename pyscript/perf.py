@@ -0,0 +1,221 @@
+"""
+A timeline of where a page spends its time.
+
+When enabled, this module records named spans of time, such as each
+`pyscript` submodule import, while a page starts up and whenever your own
+code asks it to. Each span is also recorded with the browser's
+[`performance.measure`](https://developer.mozilla.org/en-US/docs/Web/API/Performance/measure)
+API, so it shows up in the browser's developer tools too.
+
+The timeline is off by default. Turn it on with the `perf` flag in your
+configuration:
+
+```json
+{
+    "perf": true
+}
+```
+
+Then, once your page has started, look at where the time went:
+
+```python
+from pyscript import perf
+
+
+perf.summary()
+```
+
+Your own code can add spans to the timeline:
+
+```python
+from pyscript import perf
+
+
+with perf.span("load data"):
+    data = load_data()
+```
+
+Every span is a dictionary with `name`, `start`, `end` and `duration` keys.
+Times are in milliseconds since the page started to load (as used by
+`performance.now()`). The first span, `"boot"`, runs from the start of the
+page load until `pyscript` is first imported, so includes the time spent
+booting the interpreter and installing packages.
+
+When the timeline is disabled, `span()` and `record()` do nothing, so
+leaving them in your code costs next to nothing.
+"""
+
+import js
+from polyscript import config as _polyscript_config
+
+# This module is imported before any other `pyscript` submodule, so time
+# `pyscript.ffi` (which it needs) here, before the timeline can record it.
+_ffi_start = js.performance.now()
+from pyscript.ffi import to_js
+
+_ffi_end = js.performance.now()
+
+# Recorded spans, in the order they finished.
+_spans = []
+
+
+def _enabled_in_config():
+    """
+    Return whether the `perf` flag is set in the page's configuration.
+    """
+    try:
+        return js.Reflect.get(_polyscript_config, "perf") is True
+    except Exception:
+        # No configuration, or one that isn't an object.
+        return False
+
+
+enabled = _enabled_in_config()
+"""Whether spans are being recorded."""
+
+
+def enable(on=True):
+    """
+    Start (or, if `on` is false, stop) recording spans at runtime.
+    """
+    global enabled
+    enabled = bool(on)
+
+
+def record(name, start, end=None):
+    """
+    Add a span called `name`, from the `start` time until the `end` time
+    (defaulting to now), to the timeline. Both times are in milliseconds,
+    as returned by `performance.now()`.
+
+    ```python
+    import js
+    from pyscript import perf
+
+
+    start = js.performance.now()
+    do_something()
+    perf.record("do something", start)
+    ```
+    """
+    if not enabled:
+        return
+    if end is None:
+        end = js.performance.now()
+    js.performance.measure(name, to_js({"start": start, "end": end}))
+    _spans.append(
+        {"name": name, "start": start, "end": end, "duration": end - start}
+    )
+
+
+class Span:
+    """
+    A named span of time, recorded when used as a context manager (or when
+    `end()` is called).
+
+    Create these with the `span()` function rather than directly.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.start = js.performance.now()
+
+    def end(self):
+        """
+        Finish the span and add it to the timeline.
+        """
+        record(self.name, self.start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end()
+        return False
+
+
+class _NoSpan:
+    """
+    Stands in for a `Span` when the timeline is disabled.
+    """
+
+    def end(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    """
+    Return a span called `name`, starting now. Use it as a context manager,
+    or call its `end()` method, to add it to the timeline.
+
+    ```python
+    from pyscript import perf
+
+
+    with perf.span("render chart"):
+        render_chart()
+
+    s = perf.span("wait for reply")
+    reply = await ask_server()
+    s.end()
+    ```
+    """
+    if not enabled:
+        return _NO_SPAN
+    return Span(name)
+
+
+def timeline():
+    """
+    Return a list of the recorded spans (dictionaries with `name`, `start`,
+    `end` and `duration` keys) ordered by when they started.
+    """
+    return sorted(_spans, key=lambda s: s["start"])
+
+
+def clear():
+    """
+    Forget all the recorded spans.
+    """
+    _spans.clear()
+
+
+def summary():
+    """
+    Print the timeline as a table of spans with their start times and
+    durations, followed by the total time they cover.
+
+    Nested spans (such as a submodule imported while importing another)
+    are indented beneath the span containing them.
+    """
+    spans = timeline()
+    if not spans:
+        print("No spans recorded (is the perf flag set in your config?)")
+        return
+    open_spans = []
+    print(f"{'start':>10} {'duration':>10}  name")
+    for s in spans:
+        while open_spans and open_spans[-1]["end"] <= s["start"]:
+            open_spans.pop()
+        indent = "  " * len(open_spans)
+        print(
+            f"{s['start']:>8.1f}ms {s['duration']:>8.1f}ms  {indent}{s['name']}"
+        )
+        open_spans.append(s)
+    total = max(s["end"] for s in spans) - spans[0]["start"]
+    print(f"{'':>10} {total:>8.1f}ms  total")
+
+
+# From the start of the page load until `pyscript` started being imported:
+# interpreter boot and package installs.
+record("boot", 0, _ffi_start)
+record("import pyscript.ffi", _ffi_start, _ffi_end)
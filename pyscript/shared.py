@@ -0,0 +1,484 @@
+"""
+This module provides memory that is shared between the main thread and
+[web workers](https://developer.mozilla.org/en-US/docs/Web/API/Web_Workers_API),
+backed by a
+[SharedArrayBuffer](https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/SharedArrayBuffer),
+along with
+[Atomics](https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Atomics)
+based tools to coordinate access to it.
+
+Passing a shared object to a worker function sends only a reference to the
+underlying memory, rather than a copy. All threads then read and write the
+very same data.
+
+- `SharedArray`: A fixed-size array of numbers.
+- `Lock`: A mutual exclusion lock.
+- `Barrier`: Wait until a number of threads all reach the same point.
+- `RingBuffer`: A single producer, single consumer queue of bytes.
+
+Every class can either create new shared memory, or wrap memory created
+elsewhere via the `buffer` argument. The `buffer` attribute of each
+instance is the `SharedArrayBuffer` to pass between threads.
+
+```python
+from pyscript import workers
+from pyscript.shared import SharedArray
+
+
+# On the main thread: allocate a million floats and share them.
+data = SharedArray(1_000_000, dtype="float64")
+data.write(initial_values)
+worker = await workers["processor"]
+await worker.normalise(data.buffer)
+
+# All changes made by the worker are visible here.
+result = data.read()
+```
+
+In the worker:
+
+```python
+from pyscript.shared import SharedArray
+
+
+def normalise(buffer):
+    data = SharedArray(dtype="float64", buffer=buffer)
+    ...
+
+__export__ = ["normalise"]
+```
+
+!!! warning
+
+    Shared memory is **only available if the page is
+    [cross-origin isolated](https://developer.mozilla.org/en-US/docs/Web/API/Window/crossOriginIsolated)**.
+    This requires the same HTTP headers as using `window` and `document`
+    from a worker. See
+    [our FAQ](https://docs.pyscript.net/latest/faq/#sharedarraybuffer)
+    for details.
+"""
+
+import asyncio
+import js
+from pyscript.context import RUNNING_IN_WORKER
+from pyscript.ffi import from_typed_array, to_typed_array
+
+SHARED_MEMORY = bool(getattr(js, "crossOriginIsolated", False))
+"""True if shared memory can be used in the current context."""
+
+_TYPED_ARRAYS = {
+    "int8": "Int8Array",
+    "uint8": "Uint8Array",
+    "int16": "Int16Array",
+    "uint16": "Uint16Array",
+    "int32": "Int32Array",
+    "uint32": "Uint32Array",
+    "float32": "Float32Array",
+    "float64": "Float64Array",
+}
+
+
+def _allocate(byte_length, buffer):
+    """
+    Return the given `buffer`, or allocate a new `SharedArrayBuffer` of
+    `byte_length` bytes if `buffer` is `None`.
+    """
+    if buffer is not None:
+        return buffer
+    if not SHARED_MEMORY:
+        raise RuntimeError(
+            "Shared memory requires a cross-origin isolated page. "
+            "See: https://docs.pyscript.net/latest/faq/#sharedarraybuffer"
+        )
+    return js.SharedArrayBuffer.new(byte_length)
+
+
+async def _wait_async(int32, index, value):
+    """
+    Wait, without blocking the thread, until `int32[index]` is no longer
+    `value`.
+    """
+    if hasattr(js.Atomics, "waitAsync"):
+        result = js.Atomics.waitAsync(int32, index, value)
+        # "async" is a Python keyword, hence getattr.
+        if getattr(result, "async"):
+            await result.value
+        return
+    # Fallback for browsers without Atomics.waitAsync: poll.
+    while js.Atomics.load(int32, index) == value:
+        await asyncio.sleep(0.001)
+
+
+def _wait(int32, index, value):
+    """
+    Block the current worker until `int32[index]` is no longer `value`.
+    """
+    if not RUNNING_IN_WORKER:
+        raise RuntimeError("The main thread cannot block. Use the async version.")
+    js.Atomics.wait(int32, index, value)
+
+
+class SharedArray:
+    """
+    A fixed-size array of numbers in shared memory.
+
+    Items are read and written individually via indexing (each access goes
+    straight to the shared memory), or in bulk via `read()` and `write()`,
+    which copy whole ranges in one go. Integer arrays also support atomic
+    operations.
+
+    ```python
+    import numpy as np
+    from pyscript.shared import SharedArray
+
+
+    counts = SharedArray(256, dtype="int32")
+    counts[0] = 42
+    counts.add(1, 5)  # Atomic, safe to use from several workers.
+
+    # Bulk copies to and from NumPy (Pyodide only).
+    pixels = SharedArray(640 * 480, dtype="float32")
+    pixels.write(np.zeros(640 * 480, dtype=np.float32))
+    as_numpy = np.asarray(pixels.read())
+    ```
+
+    The supported `dtype` values are `int8`, `uint8`, `int16`, `uint16`,
+    `int32`, `uint32`, `float32` and `float64`.
+    """
+
+    def __init__(self, length=None, dtype="float64", buffer=None):
+        """
+        Create a shared array of `length` items of the given `dtype`, or
+        wrap an existing `SharedArrayBuffer` passed as `buffer` (in which
+        case `length` is worked out from the size of the buffer).
+        """
+        if dtype not in _TYPED_ARRAYS:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        typed_array_class = getattr(js, _TYPED_ARRAYS[dtype])
+        if buffer is None and length is None:
+            raise ValueError("Either length or buffer is required.")
+        item_size = typed_array_class.BYTES_PER_ELEMENT
+        self.buffer = _allocate((length or 0) * item_size, buffer)
+        """The underlying `SharedArrayBuffer`."""
+        self.dtype = dtype
+        self._typed_array_class = typed_array_class
+        self._array = typed_array_class.new(self.buffer)
+
+    def __len__(self):
+        return self._array.length
+
+    def __repr__(self):
+        return f"<SharedArray {self.dtype}[{len(self)}]>"
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SharedArray index out of range.")
+        return self._array[index]
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SharedArray index out of range.")
+        self._array[index] = value
+
+    def read(self, start=0, stop=None):
+        """
+        Copy the items from `start` to `stop` (default: the end) into a
+        Python `memoryview` in one go.
+        """
+        stop = len(self) if stop is None else stop
+        return from_typed_array(self._array.subarray(start, stop))
+
+    def write(self, data, start=0):
+        """
+        Copy all the items of the Python buffer `data` (a `memoryview`,
+        `array.array`, NumPy array etc... of the same item type) into the
+        array, beginning at `start`.
+        """
+        values = to_typed_array(data)
+        item_size = self._array.BYTES_PER_ELEMENT
+        if values.BYTES_PER_ELEMENT != item_size:
+            # MicroPython only provides raw bytes, so view them as items.
+            values = self._typed_array_class.new(
+                values.buffer, values.byteOffset, values.byteLength // item_size
+            )
+        self._array.set(values, start)
+
+    def load(self, index):
+        """
+        Atomically read the integer at `index`.
+        """
+        return js.Atomics.load(self._array, index)
+
+    def store(self, index, value):
+        """
+        Atomically write the integer `value` at `index`.
+        """
+        return js.Atomics.store(self._array, index, value)
+
+    def add(self, index, value):
+        """
+        Atomically add `value` to the integer at `index`. Returns the
+        previous value.
+        """
+        return js.Atomics.add(self._array, index, value)
+
+    def compare_exchange(self, index, expected, value):
+        """
+        Atomically set the integer at `index` to `value`, but only if it
+        currently is `expected`. Returns the previous value.
+        """
+        return js.Atomics.compareExchange(self._array, index, expected, value)
+
+
+class Lock:
+    """
+    A mutual exclusion lock in shared memory, usable from the main thread
+    and any number of workers.
+
+    Workers may block while waiting for the lock (`with lock:`). The main
+    thread must never block, so it should use `async with lock:` instead
+    (this also works in workers).
+
+    ```python
+    from pyscript.shared import Lock
+
+
+    lock = Lock()
+
+    # Pass lock.buffer to a worker, which does:
+    # lock = Lock(buffer=buffer)
+
+    async with lock:
+        # Only one thread at a time gets here.
+        ...
+    ```
+    """
+
+    _UNLOCKED = 0
+    _LOCKED = 1
+
+    def __init__(self, buffer=None):
+        """
+        Create a new lock, or wrap the existing lock in `buffer`.
+        """
+        self.buffer = _allocate(4, buffer)
+        """The underlying `SharedArrayBuffer`."""
+        self._state = js.Int32Array.new(self.buffer)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *args):
+        self.release()
+
+    def _try_acquire(self):
+        return (
+            js.Atomics.compareExchange(self._state, 0, self._UNLOCKED, self._LOCKED)
+            == self._UNLOCKED
+        )
+
+    def locked(self):
+        """
+        Return `True` if the lock is currently held.
+        """
+        return js.Atomics.load(self._state, 0) == self._LOCKED
+
+    def acquire(self, blocking=True):
+        """
+        Acquire the lock, blocking until it is free unless `blocking` is
+        `False`. Returns `True` if the lock was acquired.
+
+        Blocking is only allowed in workers.
+        """
+        while not self._try_acquire():
+            if not blocking:
+                return False
+            _wait(self._state, 0, self._LOCKED)
+        return True
+
+    async def acquire_async(self):
+        """
+        Acquire the lock without blocking the thread while waiting.
+        """
+        while not self._try_acquire():
+            await _wait_async(self._state, 0, self._LOCKED)
+        return True
+
+    def release(self):
+        """
+        Release the lock and wake up one waiting thread.
+        """
+        js.Atomics.store(self._state, 0, self._UNLOCKED)
+        js.Atomics.notify(self._state, 0, 1)
+
+
+class Barrier:
+    """
+    A barrier in shared memory, which makes `parties` threads wait for
+    each other before any of them carry on. The barrier can be reused.
+
+    ```python
+    from pyscript.shared import Barrier
+
+
+    # Created on the main thread for four workers.
+    barrier = Barrier(4)
+
+    # In each worker, with barrier = Barrier(buffer=buffer):
+    compute_first_half()
+    barrier.wait()  # Everyone finishes the first half...
+    compute_second_half()  # ...before anyone starts the second.
+    ```
+    """
+
+    def __init__(self, parties=None, buffer=None):
+        """
+        Create a barrier for `parties` threads, or wrap the existing
+        barrier in `buffer`.
+        """
+        if buffer is None and not parties:
+            raise ValueError("A barrier needs at least one party.")
+        self.buffer = _allocate(12, buffer)
+        """The underlying `SharedArrayBuffer`."""
+        # [arrived count, generation, number of parties]
+        self._state = js.Int32Array.new(self.buffer)
+        if buffer is None:
+            self._state[2] = parties
+
+    @property
+    def parties(self):
+        """
+        The number of threads required to pass the barrier.
+        """
+        return self._state[2]
+
+    def _arrive(self):
+        """
+        Register arrival at the barrier. Returns the generation to wait
+        on, or `None` if this was the last arrival (which releases all
+        the others).
+        """
+        generation = js.Atomics.load(self._state, 1)
+        if js.Atomics.add(self._state, 0, 1) + 1 == self.parties:
+            js.Atomics.store(self._state, 0, 0)
+            js.Atomics.add(self._state, 1, 1)
+            js.Atomics.notify(self._state, 1)
+            return None
+        return generation
+
+    def wait(self):
+        """
+        Block until all parties have called `wait()`. Workers only.
+        """
+        generation = self._arrive()
+        if generation is None:
+            return
+        while js.Atomics.load(self._state, 1) == generation:
+            _wait(self._state, 1, generation)
+
+    async def wait_async(self):
+        """
+        Wait until all parties have arrived, without blocking the thread.
+        """
+        generation = self._arrive()
+        if generation is None:
+            return
+        while js.Atomics.load(self._state, 1) == generation:
+            await _wait_async(self._state, 1, generation)
+
+
+class RingBuffer:
+    """
+    A fixed-capacity queue of bytes in shared memory for one producer
+    thread and one consumer thread. Neither side ever blocks: `write()`
+    only writes what fits and `read()` only returns what is available.
+
+    ```python
+    from pyscript.shared import RingBuffer
+
+
+    ring = RingBuffer(64 * 1024)
+
+    # Producer (e.g. a worker, with ring = RingBuffer(buffer=buffer)).
+    written = ring.write(b"some bytes")
+
+    # Consumer (e.g. the main thread).
+    data = ring.read()
+    ```
+    """
+
+    _HEADER = 8
+
+    def __init__(self, capacity=None, buffer=None):
+        """
+        Create a ring buffer holding up to `capacity` bytes, or wrap the
+        existing ring buffer in `buffer`.
+        """
+        if buffer is None and not capacity:
+            raise ValueError("A ring buffer needs a capacity.")
+        # One slot is always left empty to tell "full" from "empty".
+        self.buffer = _allocate(self._HEADER + (capacity or 0) + 1, buffer)
+        """The underlying `SharedArrayBuffer`."""
+        # [read position, write position]
+        self._positions = js.Int32Array.new(self.buffer, 0, 2)
+        self._data = js.Uint8Array.new(self.buffer, self._HEADER)
+        self._size = self._data.length
+
+    @property
+    def capacity(self):
+        """
+        The maximum number of bytes the ring buffer can hold.
+        """
+        return self._size - 1
+
+    def __len__(self):
+        """
+        The number of bytes waiting to be read.
+        """
+        head = js.Atomics.load(self._positions, 0)
+        tail = js.Atomics.load(self._positions, 1)
+        return (tail - head) % self._size
+
+    def write(self, data):
+        """
+        Write as many bytes of `data` as will fit. Returns the number of
+        bytes written.
+        """
+        data = memoryview(bytes(data))
+        count = min(len(data), self.capacity - len(self))
+        if count == 0:
+            return 0
+        tail = js.Atomics.load(self._positions, 1)
+        first = min(count, self._size - tail)
+        self._data.set(to_typed_array(data[:first]), tail)
+        if count > first:
+            self._data.set(to_typed_array(data[first:count]), 0)
+        js.Atomics.store(self._positions, 1, (tail + count) % self._size)
+        return count
+
+    def read(self, size=None):
+        """
+        Read and remove up to `size` bytes (default: everything available).
+        Returns a `memoryview`, which may be empty.
+        """
+        available = len(self)
+        count = available if size is None else min(size, available)
+        head = js.Atomics.load(self._positions, 0)
+        first = min(count, self._size - head)
+        result = bytearray(from_typed_array(self._data.subarray(head, head + first)))
+        if count > first:
+            result.extend(from_typed_array(self._data.subarray(0, count - first)))
+        js.Atomics.store(self._positions, 0, (head + count) % self._size)
+        return memoryview(result)
@@ -49,8 +49,6 @@ Tuples are deserialized as lists due to IndexedDB limitations.
 """
 
 from polyscript import storage as _polyscript_storage
-from pyscript.flatted import parse as _parse
-from pyscript.flatted import stringify as _stringify
 from pyscript.ffi import is_none
 
 
@@ -64,6 +62,8 @@ def _convert_to_idb(value):
 
     Will raise a TypeError if the value type is not supported.
     """
+    from pyscript.flatted import stringify as _stringify
+
     if is_none(value):
         return _stringify(["null", 0])
     if isinstance(value, (bool, float, int, str, list, dict, tuple)):
@@ -82,6 +82,8 @@ def _convert_from_idb(value):
     Uses type information stored during serialization to reconstruct the
     original Python type.
     """
+    from pyscript.flatted import parse as _parse
+
     kind, data = _parse(value)
 
     if kind == "null":
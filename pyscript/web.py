@@ -201,9 +201,28 @@ document and provides access to common elements like `page.body` and methods
 like `page.find()` for querying the DOM.
 """
 
+import asyncio
+import sys
+
+import js
 from js import console
-from pyscript import document, Event  # noqa: F401
-from pyscript.ffi import create_proxy, is_none
+from pyscript import document, window, Event, perf  # noqa: F401
+from pyscript.ffi import (
+    _create_proxy,
+    _release_tree,
+    create_proxy,
+    destroy_proxy,
+    from_typed_array,
+    is_none,
+    to_js,
+    to_typed_array,
+)
+
+try:
+    from weakref import ref as _weak_ref
+except ImportError:
+    # MicroPython has no weak references.
+    _weak_ref = None
 
 # Utility functions for finding and wrapping DOM elements.
 
@@ -236,6 +255,10 @@ def _find_and_wrap(dom_node, selector):
     return ElementCollection.wrap_dom_elements(dom_node.querySelectorAll(selector))
 
 
+# Element subclass -> its tag name, worked out once per class.
+_tag_names_by_class = {}
+
+
 class Element:
     """
     The base class for all [HTML elements](https://developer.mozilla.org/en-US/docs/Web/HTML/Reference/Elements).
@@ -427,7 +450,8 @@ class Element:
     ```
     """
 
-    # Lookup table: tag name -> Element subclass.
+    # Lookup table: tag name -> Element subclass. The classes for standard
+    # HTML tags are only added once they've been used.
     element_classes_by_tag_name = {}
 
     @classmethod
@@ -438,7 +462,11 @@ class Element:
         Classes ending with underscore (e.g. `input_`) have it removed to get
         the actual HTML tag name.
         """
-        return cls.__name__.replace("_", "")
+        tag_name = _tag_names_by_class.get(cls)
+        if tag_name is None:
+            tag_name = cls.__name__.replace("_", "")
+            _tag_names_by_class[cls] = tag_name
+        return tag_name
 
     @classmethod
     def register_element_classes(cls, element_classes):
@@ -466,9 +494,12 @@ class Element:
         Looks up the subclass by tag name. Unknown tags use the base `Element`
         class.
         """
-        element_cls = cls.element_classes_by_tag_name.get(
-            dom_element.tagName.lower(), cls
-        )
+        dom_tag_name = dom_element.tagName
+        tag_name = _TAGS_BY_DOM_NAME.get(dom_tag_name)
+        if tag_name is None:
+            tag_name = dom_tag_name.lower()
+            _TAGS_BY_DOM_NAME[dom_tag_name] = tag_name
+        element_cls = _element_class(tag_name) or cls
         return element_cls(dom_element=dom_element)
 
     def __init__(self, dom_element=None, classes=None, style=None, **kwargs):
@@ -582,9 +613,31 @@ class Element:
         # Create Event instance and wire it to the DOM event.
         ev = Event()
         self._on_events[name] = ev
-        self._dom_element.addEventListener(event_name, create_proxy(ev.trigger))
+        self._dom_element.addEventListener(
+            event_name, create_proxy(ev.trigger, owner=self._dom_element)
+        )
         return ev
 
+    def remove(self, index=None, release=False):
+        """
+        Remove the element from the page.
+
+        If `release` is `True`, also destroy the proxies for its event
+        handlers, and those of its descendants (attached via `on_*` events
+        or `@when`), so they can be freed. Only do this for elements that
+        won't be added back, since they lose their event handlers.
+
+        If an `index` is given, remove the option at that index instead
+        (as with a `select` element's own `remove(index)`).
+        """
+        if index is not None:
+            self._dom_element.remove(index)
+            return
+        self._dom_element.remove()
+        if release:
+            _release_tree(self._dom_element)
+            self._on_events = {}
+
     @property
     def children(self):
         """
@@ -954,8 +1007,7 @@ class Options:
         if text:
             kwargs["text"] = text
 
-        # The `option` element class is dynamically created below.
-        new_option = option(**kwargs)  # noqa: F821
+        new_option = _tag_class("option")(**kwargs)
 
         if before and isinstance(before, Element):
             before = before._dom_element
@@ -1183,7 +1235,7 @@ class canvas(ContainerElement):
     """
     A bespoke
     [HTML canvas element](https://developer.mozilla.org/en-US/docs/Web/HTML/Element/canvas)
-    with Pythonic drawing and download capabilities.
+    with Pythonic drawing, pixel access and download capabilities.
     """
 
     def download(self, filename="snapped.png"):
@@ -1192,8 +1244,7 @@ class canvas(ContainerElement):
 
         Creates a temporary download link and triggers it.
         """
-        # The `a` element class is dynamically created below.
-        download_link = a(  # noqa: F821
+        download_link = _tag_class("a")(
             download=filename, href=self._dom_element.toDataURL()
         )
         self.append(download_link)
@@ -1217,14 +1268,141 @@ class canvas(ContainerElement):
         else:
             ctx.drawImage(what, 0, 0)
 
+    def get_pixels(self, x=0, y=0, width=None, height=None):
+        """
+        Return the RGBA pixels of the canvas (or of the rectangle at `x`,
+        `y` of the given `width` and `height`) as a `memoryview` of bytes,
+        four per pixel, row by row.
+
+        The pixels are copied out of the canvas in one go, so this is cheap
+        enough to call every frame. To work with them in NumPy:
+
+        ```python
+        import numpy as np
+
+
+        pixels = np.asarray(my_canvas.get_pixels()).reshape(
+            my_canvas.height, my_canvas.width, 4
+        )
+        ```
+        """
+        width = width if width else self.width - x
+        height = height if height else self.height - y
+        ctx = self._dom_element.getContext("2d")
+        return from_typed_array(ctx.getImageData(x, y, width, height).data)
+
+    def put_pixels(self, pixels, x=0, y=0, width=None):
+        """
+        Paint RGBA `pixels` (a `bytes`-like object, `memoryview` or NumPy
+        array of bytes, four per pixel, row by row) onto the canvas, at `x`,
+        `y`. The rectangle is `width` pixels wide (by default, the width of
+        the canvas) and as tall as the pixels require.
+
+        The pixels are copied into the canvas in one go. Raises `ValueError`
+        unless they make up a whole number of rows.
+        """
+        width = width if width else self.width - x
+        data = to_typed_array(pixels)
+        row_bytes = 4 * width
+        if width <= 0 or not data.byteLength or data.byteLength % row_bytes:
+            raise ValueError(
+                f"Expected a whole number of rows of {width} RGBA pixels "
+                f"({row_bytes} bytes each), got {data.byteLength} bytes."
+            )
+        clamped = js.Uint8ClampedArray.new(
+            data.buffer, data.byteOffset, data.byteLength
+        )
+        height = data.byteLength // row_bytes
+        ctx = self._dom_element.getContext("2d")
+        ctx.putImageData(js.ImageData.new(clamped, width, height), x, y)
+
+    def transfer_to(self, worker, key=None):
+        """
+        Hand control of the canvas over to the named `worker`, where
+        `await pyscript.workers.receive(key)` returns it as an
+        [OffscreenCanvas](https://developer.mozilla.org/en-US/docs/Web/API/OffscreenCanvas).
+        The `key` defaults to the canvas's `id`.
+
+        Whatever the worker draws is shown on the page, without blocking
+        the main thread. Afterwards, the canvas can no longer be drawn on
+        from the main thread.
+
+        ```python
+        # Main thread.
+        await workers["renderer"]
+        web.page["#view"].transfer_to("renderer")
+
+        # In the "renderer" worker.
+        from pyscript.workers import receive
+
+        canvas = await receive("view")
+        canvas.getContext("2d").fillRect(0, 0, 50, 50)
+        ```
+        """
+        from pyscript.workers import transfer
+
+        offscreen = self._dom_element.transferControlToOffscreen()
+        transfer(worker, key or self.id, offscreen)
+
+    async def to_blob(self, type="image/png", quality=None):
+        """
+        Export the canvas content as an image
+        [Blob](https://developer.mozilla.org/en-US/docs/Web/API/Blob) of the
+        given MIME `type`. For lossy formats, such as `"image/jpeg"` or
+        `"image/webp"`, the `quality` is a number between 0 and 1.
+
+        Unlike a data URL, the image is encoded asynchronously and never
+        turned into a (large) string.
+        """
+        done = asyncio.Event()
+        result = []
+
+        def callback(blob):
+            result.append(blob)
+            done.set()
+
+        proxy = _create_proxy(callback)
+        self._dom_element.toBlob(proxy, type, quality)
+        await done.wait()
+        destroy_proxy(proxy)
+        return result[0]
+
 
 class video(ContainerElement):
     """
     A bespoke
     [HTML video element](https://developer.mozilla.org/en-US/docs/Web/HTML/Element/video)
-    with Pythonic snapshot capability (to render an image to a canvas).
+    with Pythonic snapshot capability (to render an image to a canvas) and
+    continuous frame capture.
     """
 
+    def frames(self, fps=None, size=None, format="rgba"):
+        """
+        Return an asynchronous iterator of frames from the video (see
+        `VideoFrames`), at most `fps` frames per second (by default, as fast
+        as the video produces them), scaled to `size` (a `(width, height)`
+        tuple, by default the video's own size).
+
+        The `format` is `"rgba"` for a `memoryview` of RGBA bytes (four per
+        pixel, row by row) or `"bitmap"` for an
+        [ImageBitmap](https://developer.mozilla.org/en-US/docs/Web/API/ImageBitmap)
+        (for drawing elsewhere, or sending to a worker).
+
+        ```python
+        import numpy as np
+
+
+        async with my_video.frames(fps=15, size=(320, 240)) as frames:
+            async for frame in frames:
+                pixels = np.asarray(frame).reshape(240, 320, 4)
+                ...
+                if done:
+                    break
+        print(frames.fps, frames.dropped)
+        ```
+        """
+        return VideoFrames(self, fps, size, format)
+
     def snap(self, to=None, width=None, height=None):
         """
         Capture a video frame `to` a canvas element. Optionally scale to
@@ -1253,6 +1431,184 @@ class video(ContainerElement):
         return to
 
 
+class VideoFrames:
+    """
+    An asynchronous iterator of frames captured from a `video` element,
+    created via `video.frames()`.
+
+    Frames are captured only when the consumer asks for the next one: any
+    frames the video produced in the meantime are skipped (and counted in
+    `dropped`), so a slow consumer always gets the latest frame and never
+    falls behind. One offscreen canvas, and (in Pyodide) one RGBA buffer,
+    is reused for every frame, so copy a frame if you need to keep it
+    beyond the next iteration.
+
+    The `delivered` and `dropped` frame counts and the actual throughput in
+    frames per second (`fps`) are available as attributes.
+
+    Capturing continues until `stop()` (or `aclose()`) is called, so use
+    it as an async context manager to stop it however the loop ends:
+
+    ```python
+    async with my_video.frames(fps=15) as frames:
+        async for frame in frames:
+            if done(frame):
+                break
+    ```
+
+    In Pyodide, an iterator dropped without being stopped also stops once
+    it's garbage collected.
+    """
+
+    def __init__(self, video, fps=None, size=None, format="rgba"):
+        if format not in ("rgba", "bitmap"):
+            raise ValueError(f"Unknown frame format: {format}")
+        self.video = video
+        self.format = format
+        self.delivered = 0
+        self.dropped = 0
+        self._interval = 1000 / fps if fps else 0
+        self._size = size
+        self._canvas = None
+        self._context = None
+        self._buffer = None
+        self._pending = 0
+        self._last = None
+        self._started = None
+        self._stopped = False
+        self._ready = asyncio.Event()
+        self._element = video._dom_element
+        # Prefer being told about each new video frame, fall back to once
+        # per animation frame.
+        self._uses_frame_callback = hasattr(
+            self._element, "requestVideoFrameCallback"
+        )
+        self._last_time = None
+        self._handle = None
+        if _weak_ref is None:
+            on_frame = self._on_frame
+        else:
+            # Only hold on to this iterator weakly from JavaScript, so an
+            # abandoned one is collected (and stops itself in `__del__`).
+            frames = _weak_ref(self)
+
+            def on_frame(*args):
+                target = frames()
+                if target is not None:
+                    target._on_frame(*args)
+
+        self._callback = _create_proxy(on_frame)
+        self._schedule()
+
+    def __del__(self):
+        # Nothing to stop if `__init__` didn't get as far as scheduling.
+        if getattr(self, "_handle", None) is not None:
+            self.stop()
+
+    @property
+    def fps(self):
+        """
+        The number of frames delivered per second so far.
+        """
+        if not self._started or not self.delivered:
+            return 0
+        elapsed = js.performance.now() - self._started
+        return self.delivered * 1000 / elapsed if elapsed else 0
+
+    def stop(self):
+        """
+        Stop capturing frames. Iteration ends after the current frame.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        # Cancel the pending callback, so the proxy can safely go.
+        if self._uses_frame_callback:
+            self._element.cancelVideoFrameCallback(self._handle)
+        else:
+            window.cancelAnimationFrame(self._handle)
+        destroy_proxy(self._callback)
+        self._ready.set()
+
+    async def aclose(self):
+        """
+        Stop capturing frames (the same as `stop()`).
+        """
+        self.stop()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _schedule(self):
+        if self._uses_frame_callback:
+            self._handle = self._element.requestVideoFrameCallback(self._callback)
+        else:
+            self._handle = window.requestAnimationFrame(self._callback)
+
+    def _on_frame(self, now, *args):
+        if self._stopped:
+            return
+        if not self._uses_frame_callback:
+            # Only count animation frames that show a new video frame.
+            current = self._element.currentTime
+            if current == self._last_time:
+                self._schedule()
+                return
+            self._last_time = current
+        if self._last is None or now - self._last >= self._interval:
+            self._last = now
+            self._pending += 1
+            self._ready.set()
+        self._schedule()
+
+    def _capture(self):
+        width, height = self._size or (
+            self._element.videoWidth,
+            self._element.videoHeight,
+        )
+        if self._canvas is None:
+            self._canvas = js.OffscreenCanvas.new(width, height)
+            self._context = self._canvas.getContext("2d")
+        elif self._canvas.width != width or self._canvas.height != height:
+            # The video's resolution changed.
+            self._canvas.width = width
+            self._canvas.height = height
+        self._context.drawImage(self._element, 0, 0, width, height)
+        data = self._context.getImageData(0, 0, width, height).data
+        if hasattr(data, "assign_to"):
+            # Pyodide can copy straight into a reused buffer.
+            if self._buffer is None or len(self._buffer) != data.length:
+                self._buffer = bytearray(data.length)
+            data.assign_to(self._buffer)
+            return memoryview(self._buffer)
+        return from_typed_array(data)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._ready.wait()
+        self._ready.clear()
+        if self._stopped:
+            raise StopAsyncIteration
+        if self._started is None:
+            self._started = js.performance.now()
+        self.dropped += self._pending - 1
+        self._pending = 0
+        self.delivered += 1
+        if self.format == "bitmap":
+            if self._size:
+                width, height = self._size
+                options = {"resizeWidth": width, "resizeHeight": height}
+                return await js.createImageBitmap(self._element, to_js(options))
+            return await js.createImageBitmap(self._element)
+        return self._capture()
+
+
 class datalist(ContainerElement, HasOptions):
     """
     HTML datalist element with options support.
@@ -1331,41 +1687,97 @@ Void elements that cannot have children. Each becomes a class in the
 """
 
 
-def _create_element_classes():
+# Tags whose classes get a trailing underscore, to avoid clashing with Python
+# keywords and builtins.
+_CLASS_NAMES = {"del": "del_", "input": "input_", "map": "map_", "object": "object_"}
+
+# Tag name -> base class, for the classes created the first time they're used.
+_LAZY_TAGS = dict.fromkeys(CONTAINER_TAGS, ContainerElement)
+_LAZY_TAGS.update(dict.fromkeys(VOID_TAGS, Element))
+
+# Python class name -> tag name, for the lazily created classes.
+_TAGS_BY_CLASS_NAME = {_CLASS_NAMES.get(tag, tag): tag for tag in _LAZY_TAGS}
+
+# DOM `tagName` (upper case for HTML elements) -> tag name, so wrapping an
+# element doesn't need to lowercase its `tagName` every time.
+_TAGS_BY_DOM_NAME = {tag.upper(): tag for tag in _LAZY_TAGS}
+
+
+def _create_element_class(tag):
     """
-    Create element classes dynamically and register them.
+    Create the class for the standard HTML `tag`, add it to the
+    `pyscript.web` namespace and register it (unless another class is
+    already registered for the tag).
+    """
+    class_name = _CLASS_NAMES.get(tag, tag)
+    doc = (
+        f"HTML <{tag}> element. "
+        f"Ref: https://developer.mozilla.org/en-US/docs/Web/HTML/"
+        f"Element/{tag}"
+    )
+    cls = type(class_name, (_LAZY_TAGS[tag],), {"__doc__": doc})
+    globals()[class_name] = cls
+    Element.element_classes_by_tag_name.setdefault(tag, cls)
+    return cls
 
-    Generates classes for all standard HTML elements, using the appropriate
-    base class (ContainerElement or Element) for each tag.
+
+def _element_class(tag):
     """
-    # The existing special element classes defined above.
-    classes = [canvas, video, datalist, optgroup, select]
-    for tag in CONTAINER_TAGS:
-        # Tags that clash with Python keywords get a trailing underscore.
-        class_name = f"{tag}_" if tag in ("del", "map", "object") else tag
-        doc = (
-            f"HTML <{tag}> element. "
-            f"Ref: https://developer.mozilla.org/en-US/docs/Web/HTML/"
-            f"Element/{tag}"
-        )
-        cls = type(class_name, (ContainerElement,), {"__doc__": doc})
-        globals()[class_name] = cls
-        classes.append(cls)
-    for tag in VOID_TAGS:
-        class_name = f"{tag}_" if tag == "input" else tag
-        doc = (
-            f"HTML <{tag}> element. "
-            f"Ref: https://developer.mozilla.org/en-US/docs/Web/HTML/"
-            f"Element/{tag}"
-        )
-        cls = type(class_name, (Element,), {"__doc__": doc})
-        globals()[class_name] = cls
-        classes.append(cls)
-    Element.register_element_classes(classes)
+    Return the `Element` subclass registered for `tag`, creating it first if
+    it's a standard HTML tag whose class hasn't been used yet. Returns `None`
+    for tags without a class.
+    """
+    cls = Element.element_classes_by_tag_name.get(tag)
+    if cls is None and tag in _LAZY_TAGS:
+        if _CLASS_NAMES.get(tag, tag) not in globals():
+            cls = _create_element_class(tag)
+    return cls
+
+
+def _tag_class(tag):
+    """
+    Return the `pyscript.web` class for the standard HTML `tag`, creating it
+    if it hasn't been used yet.
+
+    Code in this module must use this rather than the class's bare name,
+    since the module `__getattr__` only handles lookups from outside it.
+    """
+    cls = globals().get(_CLASS_NAMES.get(tag, tag))
+    if cls is None:
+        cls = _create_element_class(tag)
+    return cls
+
+
+def __getattr__(name):
+    """
+    Create the class for a standard HTML tag (such as `div` or `input_`) the
+    first time it's used or imported.
+    """
+    tag = _TAGS_BY_CLASS_NAME.get(name)
+    if tag is None:
+        raise AttributeError(f"module 'pyscript.web' has no attribute '{name}'")
+    return _create_element_class(tag)
+
+
+def __dir__():
+    """
+    List the module's names, including the classes not yet created.
+    """
+    return sorted(set(globals()) | set(_TAGS_BY_CLASS_NAME))
+
 
+# The special element classes are defined above. All the others are created
+# on first use.
+_special_classes = [canvas, video, datalist, optgroup, select]
+Element.register_element_classes(_special_classes)
+for _cls in _special_classes:
+    _TAGS_BY_DOM_NAME[_cls.__name__.upper()] = _cls.__name__
 
-# Initialize element classes at module load time. :-)
-_create_element_classes()
+if "MicroPython" in sys.version:
+    # MicroPython's `from pyscript.web import *` ignores `__all__` and only
+    # copies names already defined, so create every class up front.
+    for _tag in _LAZY_TAGS:
+        _tag_class(_tag)
 
 
 class Page:
@@ -1459,5 +1871,30 @@ class Page:
         return _find_and_wrap(document, selector)
 
 
+_start = js.performance.now()
 page = Page()
 """A reference to the current web page. An instance of the `Page` class."""
+perf.record("web.Page()", _start)
+
+# The public API, including the tag classes created on first use, so that
+# `from pyscript.web import *` still provides them all (and nothing this
+# module merely imports).
+__all__ = [
+    "CONTAINER_TAGS",
+    "Classes",
+    "ContainerElement",
+    "Element",
+    "ElementCollection",
+    "HasOptions",
+    "Options",
+    "Page",
+    "Style",
+    "VOID_TAGS",
+    "VideoFrames",
+    "canvas",
+    "datalist",
+    "optgroup",
+    "page",
+    "select",
+    "video",
+] + sorted(_TAGS_BY_CLASS_NAME)
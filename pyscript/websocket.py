@@ -7,10 +7,15 @@ Use this for real-time applications:
 
 - Pythonic interface to browser WebSockets.
 - Automatic handling of async event handlers.
-- Support for receiving text (`str`) and binary (`memoryview`) data.
+- Support for receiving text (`str`) and binary (`memoryview`) data,
+  converted at most once per message (or not at all, if you prefer the
+  raw `ArrayBuffer`).
 - Support for sending text (`str`) and binary (`bytes` and `bytearray`) data.
 - Compatible with Pyodide and MicroPython.
 - Works in webworker contexts.
+- Receive messages with `async for`, with a bounded queue.
+- Batch many small messages into binary frames via `FramedChannel`.
+- Optional automatic reconnection via `ReconnectingWebSocket`.
 - Naming deliberately follows the JavaScript WebSocket API closely for
   familiarity.
 
@@ -37,34 +42,90 @@ ws.onopen = on_open
 ws.onmessage = on_message
 ws.onclose = on_close
 ```
+
+Alternatively, consume incoming messages as an async stream:
+
+```python
+ws = WebSocket(url="ws://localhost:8080/")
+
+async for data in ws:
+    print(f"Received: {data}")
+```
 """
 
+import asyncio
 import js
-from pyscript.ffi import create_proxy
+from pyscript.ffi import JsProxy, _create_proxy, destroy_proxy, to_typed_array
 from pyscript.util import as_bytearray, is_awaitable
 
 
-def _attach_event_handler(websocket, handler_name, handler_function):
+def _new_js_websocket(url, protocols):
+    """
+    Create the underlying JavaScript WebSocket for `url` and `protocols`.
+    """
+    if protocols:
+        js_websocket = js.WebSocket.new(url, protocols)
+    else:
+        js_websocket = js.WebSocket.new(url)
+    # Set binary type to arraybuffer for easier Python handling.
+    js_websocket.binaryType = "arraybuffer"
+    return js_websocket
+
+
+def _byte_size(data):
+    """
+    Return the size in bytes of `data` to be sent: a `str` (as UTF-8), a
+    Python buffer, or a JavaScript `ArrayBuffer`, typed array or `Blob`.
+    """
+    if isinstance(data, str):
+        return len(data.encode())
+    if isinstance(data, JsProxy):
+        for name in ("byteLength", "size"):
+            size = getattr(data, name, None)
+            if isinstance(size, (int, float)):
+                return int(size)
+        return 0
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    try:
+        return memoryview(data).nbytes
+    except AttributeError:
+        # MicroPython's memoryview has no `nbytes`.
+        return len(bytes(data))
+
+
+async def _destroy_proxies(proxies):
+    """
+    Destroy `proxies`. Run as a task, so a proxy can be released from within
+    its own call.
+    """
+    for proxy in proxies:
+        destroy_proxy(proxy)
+
+
+def _attach_event_handler(websocket, handler_name, handler_function, raw=False):
     """
     Given a `websocket`, and `handler_name`, attach the `handler_function`
     to the `WebSocket` instance, handling both synchronous and asynchronous
     handler functions.
 
     Creates a JavaScript proxy for the handler and wraps async handlers
-    appropriately. Handles the `WebSocketEvent` wrapping for all handlers.
+    appropriately. Handles the `WebSocketEvent` wrapping for all handlers
+    (passing on the `raw` flag). Returns the proxy.
     """
     if is_awaitable(handler_function):
 
         async def async_wrapper(event):
-            await handler_function(WebSocketEvent(event))
+            await handler_function(WebSocketEvent(event, raw))
 
-        wrapped_handler = create_proxy(async_wrapper)
+        wrapped_handler = _create_proxy(async_wrapper)
     else:
-        wrapped_handler = create_proxy(
-            lambda event: handler_function(WebSocketEvent(event))
+        wrapped_handler = _create_proxy(
+            lambda event: handler_function(WebSocketEvent(event, raw))
         )
     # Note: Direct assignment (websocket[handler_name]) fails in Pyodide.
     setattr(websocket, handler_name, wrapped_handler)
+    return wrapped_handler
 
 
 class WebSocketEvent:
@@ -88,14 +149,22 @@ class WebSocketEvent:
             # For binary messages.
             print(f"Binary: {len(event.data)} bytes")
     ```
+
+    Binary data is converted to a `memoryview` at most once, the first
+    time `event.data` is read, and then reused. If the data is only going
+    to be handed on to another JavaScript API (e.g. a canvas or WebGL),
+    use `event.raw_data` to get the original `ArrayBuffer` without
+    converting it at all, or create the `WebSocket` with
+    `raw_binary=True` so `event.data` is always the `ArrayBuffer`.
     """
 
-    def __init__(self, event):
+    def __init__(self, event, raw=False):
         """
         Create a WebSocketEvent wrapper from an underlying JavaScript
-        `event`.
+        `event`. If `raw` is `True`, binary data is not converted.
         """
         self._event = event
+        self._raw = raw
 
     def __getattr__(self, attr):
         """
@@ -105,15 +174,157 @@ class WebSocketEvent:
         arrays to Python `memoryview` objects.
         """
         value = getattr(self._event, attr)
-        if attr == "data" and not isinstance(value, str):
+        if attr == "data" and not (self._raw or isinstance(value, str)):
             if hasattr(value, "to_py"):
                 # Pyodide - convert JavaScript typed array to Python.
-                return value.to_py()
+                value = value.to_py()
             else:
                 # MicroPython - manually convert JS ArrayBuffer.
-                return memoryview(as_bytearray(value))
+                value = memoryview(as_bytearray(value))
+            # Cache it, so __getattr__ isn't called (nor the data copied)
+            # again for this attribute.
+            self.data = value
         return value
 
+    @property
+    def raw_data(self):
+        """
+        The event's data exactly as received: a `str`, or a JavaScript
+        `ArrayBuffer` for binary messages (never copied into Python).
+        """
+        return self._event.data
+
+
+class MessageStream:
+    """
+    A bounded queue of incoming messages that can be consumed with
+    `async for`, as an alternative to an `onmessage` handler. Created via
+    `WebSocket.messages()` (or implicitly with `async for ... in ws`).
+
+    ```python
+    stream = ws.messages(maxsize=500, overflow="drop-oldest")
+    async for data in stream:
+        process(data)  # A str or memoryview, just like event.data.
+
+    print(stream.received, stream.dropped, len(stream))
+    ```
+
+    Messages arriving while the queue holds `maxsize` messages are handled
+    according to the `overflow` policy:
+
+    - `"drop-oldest"` (default): discard the oldest queued message.
+    - `"drop-newest"`: discard the incoming message.
+    - `"pause"`: keep every message, but call `on_pause()` when the queue
+      fills and `on_resume()` once it has drained to half full. Browsers
+      cannot stop reading from a WebSocket, so use these callbacks to ask
+      the server to slow down (e.g. by sending it a message).
+
+    Message data is only converted to Python when it is taken from the
+    queue, so dropped messages cost next to nothing. Iteration ends once
+    the connection (or the stream, via `close()`) is closed and the queue
+    is empty. Either way, the stream's event listeners are released.
+    """
+
+    POLICIES = ("drop-oldest", "drop-newest", "pause")
+
+    def __init__(
+        self,
+        websocket,
+        maxsize=100,
+        overflow="drop-oldest",
+        on_pause=None,
+        on_resume=None,
+    ):
+        """
+        Queue messages from `websocket`. See the class docs for `maxsize`,
+        `overflow`, `on_pause` and `on_resume`.
+        """
+        if overflow not in self.POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.on_pause = on_pause
+        self.on_resume = on_resume
+        self.received = 0
+        """Number of messages received."""
+        self.dropped = 0
+        """Number of messages dropped because the queue was full."""
+        self.paused = False
+        """`True` while the queue is over capacity (`"pause"` policy only)."""
+        self._queue = []
+        self._signal = asyncio.Event()
+        self._closed = False
+        self._raw = websocket._raw_binary
+        self._websocket = websocket
+        websocket._listen(self)
+
+    def __len__(self):
+        """
+        The number of messages waiting in the queue.
+        """
+        return len(self._queue)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        data = await self.get()
+        if data is None:
+            raise StopAsyncIteration
+        return data
+
+    async def get(self):
+        """
+        Wait for and return the next message's data, or `None` if the
+        connection is closed and no messages are left.
+        """
+        while not self._queue:
+            if self._closed:
+                return None
+            self._signal.clear()
+            await self._signal.wait()
+        event = self._queue.pop(0)
+        if self.paused and len(self._queue) <= self.maxsize // 2:
+            self.paused = False
+            if self.on_resume:
+                self.on_resume()
+        return WebSocketEvent(event, self._raw).data
+
+    def close(self):
+        """
+        Stop queueing messages, leaving the connection open. Iteration ends
+        once the messages already queued have been taken.
+        """
+        self._websocket._unlisten(self)
+        self._close()
+
+    def _push(self, event):
+        """
+        Queue the raw JavaScript message `event`, applying the overflow
+        policy.
+        """
+        self.received += 1
+        if len(self._queue) >= self.maxsize:
+            if self.overflow == "drop-newest":
+                self.dropped += 1
+                return
+            if self.overflow == "drop-oldest":
+                self._queue.pop(0)
+                self.dropped += 1
+            elif not self.paused:
+                self.paused = True
+                if self.on_pause:
+                    self.on_pause()
+        self._queue.append(event)
+        self._signal.set()
+
+    def _close(self, *args):
+        """
+        Mark the stream as finished once the connection is closed.
+        """
+        self._closed = True
+        self._signal.set()
+
 
 class WebSocket:
     """
@@ -175,13 +386,16 @@ class WebSocket:
     CLOSING = 2
     CLOSED = 3
 
-    def __init__(self, url, protocols=None, **handlers):
+    def __init__(self, url, protocols=None, raw_binary=False, **handlers):
         """
         Create a new WebSocket connection from the given `url` (`ws://` or
         `wss://`). Optionally specify `protocols` (a string or a list of
         protocol strings) and event handlers (`onopen`, `onmessage`, etc.) as
         keyword arguments.
 
+        If `raw_binary` is `True`, binary messages are delivered as the
+        original JavaScript `ArrayBuffer` rather than a `memoryview`.
+
         These arguments and naming conventions mirror those of the
         [underlying JavaScript WebSocket API](https://developer.mozilla.org/en-US/docs/Web/API/WebSocket)
         for familiarity.
@@ -207,16 +421,14 @@ class WebSocket:
         )
         ```
         """
-        # Create underlying JavaScript WebSocket.
-        if protocols:
-            js_websocket = js.WebSocket.new(url, protocols)
-        else:
-            js_websocket = js.WebSocket.new(url)
-        # Set binary type to arraybuffer for easier Python handling.
-        js_websocket.binaryType = "arraybuffer"
         # Store the underlying WebSocket.
         # Use object.__setattr__ to bypass our custom __setattr__.
-        object.__setattr__(self, "_js_websocket", js_websocket)
+        object.__setattr__(self, "_js_websocket", _new_js_websocket(url, protocols))
+        object.__setattr__(self, "_stream", None)
+        object.__setattr__(self, "_raw_binary", raw_binary)
+        object.__setattr__(self, "_handler_proxies", {})
+        # id(stream) -> [(event type, proxy)] listening for each stream.
+        object.__setattr__(self, "_listeners", {})
         # Attach any event handlers passed as keyword arguments.
         for handler_name, handler in handlers.items():
             setattr(self, handler_name, handler)
@@ -235,11 +447,20 @@ class WebSocket:
         Set an attribute `attr` on the WebSocket to the given `value`.
 
         Event handler attributes (`onopen`, `onmessage`, etc.) are specially
-        handled to create proper proxies. Other attributes are set on the
-        underlying WebSocket directly.
+        handled to create proper proxies (destroying the proxy of any
+        handler they replace). Other attributes are set on the underlying
+        WebSocket directly.
         """
         if attr in ["onclose", "onerror", "onmessage", "onopen"]:
-            _attach_event_handler(self._js_websocket, attr, value)
+            previous = self._handler_proxies.pop(attr, None)
+            if value is None:
+                setattr(self._js_websocket, attr, None)
+            else:
+                self._handler_proxies[attr] = _attach_event_handler(
+                    self._js_websocket, attr, value, self._raw_binary
+                )
+            if previous is not None:
+                destroy_proxy(previous)
         else:
             setattr(self._js_websocket, attr, value)
 
@@ -263,13 +484,12 @@ class WebSocket:
 
             The WebSocket **must be in the OPEN state to send data**.
         """
-        if isinstance(data, str):
+        if isinstance(data, (str, JsProxy)):
+            # Text, and JavaScript buffers (e.g. an `ArrayBuffer` or typed
+            # array), are sent as they are.
             self._js_websocket.send(data)
         else:
-            buffer = js.Uint8Array.new(len(data))
-            for index, byte_value in enumerate(data):
-                buffer[index] = byte_value
-            self._js_websocket.send(buffer)
+            self._js_websocket.send(to_typed_array(data))
 
     def close(self, code=None, reason=None):
         """
@@ -293,3 +513,719 @@ class WebSocket:
             self._js_websocket.close(code)
         else:
             self._js_websocket.close()
+
+    def __aiter__(self):
+        """
+        Iterate over incoming message data with `async for`, using a
+        default `MessageStream` (see `messages()`).
+
+        ```python
+        async for data in ws:
+            print(data)
+        ```
+        """
+        if self._stream is None:
+            self._stream = self.messages()
+        return self._stream
+
+    def messages(
+        self, maxsize=100, overflow="drop-oldest", on_pause=None, on_resume=None
+    ):
+        """
+        Return a new `MessageStream` queueing up to `maxsize` incoming
+        messages, with the given `overflow` policy (`"drop-oldest"`,
+        `"drop-newest"` or `"pause"`, with optional `on_pause` and
+        `on_resume` callbacks). This works alongside any `onmessage`
+        handler.
+
+        ```python
+        async for data in ws.messages(maxsize=1000, overflow="drop-newest"):
+            print(data)
+        ```
+        """
+        return MessageStream(self, maxsize, overflow, on_pause, on_resume)
+
+    async def drain(self, threshold=0, interval=0.01):
+        """
+        Wait until no more than `threshold` bytes of sent data are still
+        waiting to go out over the network (see
+        [bufferedAmount](https://developer.mozilla.org/en-US/docs/Web/API/WebSocket/bufferedAmount)).
+        The amount is checked every `interval` seconds.
+
+        Use this to avoid sending faster than the connection can cope with.
+
+        ```python
+        for chunk in chunks:
+            ws.send(chunk)
+            await ws.drain(threshold=64 * 1024)
+        ```
+        """
+        while self._pending_bytes() > threshold:
+            await asyncio.sleep(interval)
+
+    def _pending_bytes(self):
+        """
+        The number of bytes sent but not yet transmitted.
+        """
+        return self._js_websocket.bufferedAmount
+
+    def _listen(self, stream):
+        """
+        Feed incoming messages to `stream` (a `MessageStream` or
+        `FramedChannel`). Its listeners are released when the connection
+        closes, or when `_unlisten()` is called.
+        """
+
+        def on_close(*args):
+            stream._close()
+            self._unlisten(stream)
+
+        listeners = [
+            ("message", _create_proxy(stream._push)),
+            ("close", _create_proxy(on_close)),
+        ]
+        self._listeners[id(stream)] = listeners
+        for event_type, proxy in listeners:
+            self._js_websocket.addEventListener(event_type, proxy)
+
+    def _unlisten(self, stream):
+        """
+        Stop feeding messages to `stream`, removing its event listeners and
+        destroying their proxies.
+        """
+        if self._stream is stream:
+            object.__setattr__(self, "_stream", None)
+        listeners = self._listeners.pop(id(stream), None)
+        if listeners is None:
+            return
+        for event_type, proxy in listeners:
+            self._js_websocket.removeEventListener(event_type, proxy)
+        asyncio.create_task(_destroy_proxies([proxy for _, proxy in listeners]))
+
+
+class ReconnectingWebSocket(WebSocket):
+    """
+    A `WebSocket` that survives network blips.
+
+    When the connection drops, it reconnects automatically, waiting longer
+    after each failed attempt (exponential backoff with a little random
+    jitter, so many clients don't all reconnect at once). Messages sent
+    while disconnected are queued and flushed, in order, once the
+    connection is back. Event handlers stay attached across reconnections.
+
+    ```python
+    from pyscript.websocket import ReconnectingWebSocket
+
+
+    def on_message(event):
+        print(event.data)
+
+    ws = ReconnectingWebSocket(
+        url="wss://example.com/feed",
+        onmessage=on_message,
+        heartbeat=15,  # Send "ping" every 15 seconds.
+    )
+
+    # Safe to call even if the connection is (re)connecting.
+    ws.send("subscribe")
+
+    print(ws.metrics)
+    ```
+
+    The outbound queue is bounded by both `max_queue` messages and
+    `max_queue_bytes` bytes. When it is full, the oldest messages are
+    dropped (and counted in `metrics["dropped"]`).
+
+    If `heartbeat` is given (in seconds), `heartbeat_message` is sent at
+    that interval while connected. A connection that receives nothing for
+    two intervals is assumed dead, and is closed and reconnected.
+
+    Calling `close()` closes the connection for good.
+    """
+
+    def __init__(
+        self,
+        url,
+        protocols=None,
+        min_delay=0.5,
+        max_delay=30,
+        backoff=2,
+        max_queue=1000,
+        max_queue_bytes=1_000_000,
+        heartbeat=None,
+        heartbeat_message="ping",
+        raw_binary=False,
+        **handlers,
+    ):
+        """
+        Create a reconnecting WebSocket connection to `url` with optional
+        `protocols`, `raw_binary` flag and event handlers (as for
+        `WebSocket`).
+
+        After a dropped connection, the first reconnection attempt happens
+        after `min_delay` seconds, and each further attempt waits `backoff`
+        times longer, up to `max_delay` seconds.
+        """
+        object.__setattr__(self, "_url", url)
+        object.__setattr__(self, "_raw_binary", raw_binary)
+        object.__setattr__(self, "_protocols", protocols)
+        object.__setattr__(self, "_handlers", {})
+        object.__setattr__(self, "_queue", [])
+        settings = {
+            "min_delay": min_delay,
+            "max_delay": max_delay,
+            "backoff": backoff,
+            "max_queue": max_queue,
+            "max_queue_bytes": max_queue_bytes,
+            "heartbeat": heartbeat,
+            "heartbeat_message": heartbeat_message,
+        }
+        object.__setattr__(self, "_settings", settings)
+        metrics = {
+            "state": "connecting",
+            "connects": 0,
+            "reconnect_attempts": 0,
+            "messages_sent": 0,
+            "messages_received": 0,
+            "queued": 0,
+            "queued_bytes": 0,
+            "dropped": 0,
+            "downtime_ms": 0,
+        }
+        object.__setattr__(self, "_metrics", metrics)
+        object.__setattr__(self, "_stream", None)
+        object.__setattr__(self, "_streams", [])
+        object.__setattr__(self, "_attempt", 0)
+        object.__setattr__(self, "_generation", 0)
+        object.__setattr__(self, "_closed", False)
+        object.__setattr__(self, "_timer", None)
+        object.__setattr__(self, "_heartbeat_timer", None)
+        object.__setattr__(self, "_last_seen", 0)
+        object.__setattr__(self, "_down_since", js.performance.now())
+        # Proxies are created once and reused for every connection.
+        js_handlers = {
+            "onopen": _create_proxy(self._on_open),
+            "onmessage": _create_proxy(self._on_message),
+            "onclose": _create_proxy(self._on_close),
+            "onerror": _create_proxy(self._on_error),
+        }
+        object.__setattr__(self, "_js_handlers", js_handlers)
+        object.__setattr__(self, "_connect_proxy", _create_proxy(self._connect))
+        object.__setattr__(self, "_heartbeat_proxy", _create_proxy(self._beat))
+        for handler_name, handler in handlers.items():
+            setattr(self, handler_name, handler)
+        self._connect()
+
+    def __setattr__(self, attr, value):
+        """
+        Remember event handlers (so they survive reconnection) and set
+        other public attributes on the current underlying WebSocket.
+        """
+        if attr in self._js_handlers:
+            self._handlers[attr] = value
+        elif attr.startswith("_"):
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self._js_websocket, attr, value)
+
+    @property
+    def metrics(self):
+        """
+        A dict describing the connection: its `state` (`connecting`,
+        `open`, `reconnecting` or `closed`), the number of successful
+        `connects` and `reconnect_attempts`, counts of `messages_sent` and
+        `messages_received`, the messages and bytes currently `queued`,
+        the number of queued messages `dropped`, and the total
+        `downtime_ms`.
+        """
+        return dict(self._metrics)
+
+    def send(self, data):
+        """
+        Send `data` if connected, otherwise queue it to be sent once the
+        connection is re-established.
+        """
+        if self._closed:
+            raise RuntimeError("WebSocket has been closed.")
+        if self._js_websocket.readyState == self.OPEN:
+            WebSocket.send(self, data)
+            self._metrics["messages_sent"] += 1
+        else:
+            self._enqueue(data)
+
+    def close(self, code=None, reason=None):
+        """
+        Close the connection for good: no reconnection will be attempted
+        and queued messages are discarded. Optionally specify a `code`
+        and `reason` (as for `WebSocket.close()`).
+        """
+        self._closed = True
+        self._stop_timers()
+        self._queue = []
+        self._metrics["queued"] = 0
+        self._metrics["queued_bytes"] = 0
+        self._metrics["state"] = "closed"
+        streams, self._streams = self._streams, []
+        for stream in streams:
+            stream._close()
+        WebSocket.close(self, code, reason)
+
+    def _pending_bytes(self):
+        """
+        Bytes queued while disconnected, plus those not yet transmitted.
+        """
+        return self._metrics["queued_bytes"] + self._js_websocket.bufferedAmount
+
+    def _listen(self, stream):
+        """
+        Feed messages from every connection to `stream` (a `MessageStream`
+        or `FramedChannel`), which only ends when `close()` is called.
+        """
+        self._streams.append(stream)
+
+    def _unlisten(self, stream):
+        """
+        Stop feeding messages to `stream`.
+        """
+        if self._stream is stream:
+            self._stream = None
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    def _connect(self, *args):
+        """
+        Open a new underlying connection and wire up the event handlers.
+        """
+        self._timer = None
+        if self._closed:
+            return
+        js_websocket = _new_js_websocket(self._url, self._protocols)
+        # Tag each connection, so events from replaced ones can be told
+        # apart (comparing proxies of the sockets themselves isn't reliable).
+        self._generation += 1
+        js_websocket.pyscriptGeneration = self._generation
+        for name, proxy in self._js_handlers.items():
+            setattr(js_websocket, name, proxy)
+        self._js_websocket = js_websocket
+
+    def _dispatch(self, name, event):
+        """
+        Call the user's handler for `name`, if any, with the `event`.
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            return
+        if is_awaitable(handler):
+            asyncio.create_task(handler(WebSocketEvent(event, self._raw_binary)))
+        else:
+            handler(WebSocketEvent(event, self._raw_binary))
+
+    def _on_open(self, event):
+        now = js.performance.now()
+        self._metrics["downtime_ms"] += now - self._down_since
+        self._metrics["connects"] += 1
+        self._metrics["state"] = "open"
+        self._attempt = 0
+        self._last_seen = now
+        # Flush messages queued while disconnected, oldest first.
+        queue, self._queue = self._queue, []
+        self._metrics["queued"] = 0
+        self._metrics["queued_bytes"] = 0
+        for data, _ in queue:
+            self.send(data)
+        heartbeat = self._settings["heartbeat"]
+        if heartbeat:
+            self._heartbeat_timer = js.setInterval(
+                self._heartbeat_proxy, heartbeat * 1000
+            )
+        self._dispatch("onopen", event)
+
+    def _on_message(self, event):
+        self._metrics["messages_received"] += 1
+        self._last_seen = js.performance.now()
+        for stream in self._streams:
+            stream._push(event)
+        self._dispatch("onmessage", event)
+
+    def _on_error(self, event):
+        self._dispatch("onerror", event)
+
+    def _on_close(self, event):
+        if event.target.pyscriptGeneration != self._generation:
+            # A close event from a connection already replaced.
+            return
+        self._dispatch("onclose", event)
+        if self._closed:
+            return
+        self._stop_timers()
+        if self._metrics["state"] == "open":
+            self._down_since = js.performance.now()
+        self._metrics["state"] = "reconnecting"
+        # Exponential backoff with up to 20% jitter to avoid storms.
+        settings = self._settings
+        delay = min(
+            settings["max_delay"],
+            settings["min_delay"] * settings["backoff"] ** self._attempt,
+        )
+        delay *= 1 + js.Math.random() * 0.2
+        self._attempt += 1
+        self._metrics["reconnect_attempts"] += 1
+        self._timer = js.setTimeout(self._connect_proxy, delay * 1000)
+
+    def _beat(self, *args):
+        """
+        Send a heartbeat, or drop a connection that has gone quiet.
+        """
+        interval = self._settings["heartbeat"] * 1000
+        if js.performance.now() - self._last_seen > 2 * interval:
+            # Nothing heard for too long: force a reconnection.
+            self._js_websocket.close()
+        elif self._js_websocket.readyState == self.OPEN:
+            self.send(self._settings["heartbeat_message"])
+
+    def _stop_timers(self):
+        if self._timer is not None:
+            js.clearTimeout(self._timer)
+            self._timer = None
+        if self._heartbeat_timer is not None:
+            js.clearInterval(self._heartbeat_timer)
+            self._heartbeat_timer = None
+
+    def _enqueue(self, data):
+        """
+        Queue `data`, dropping the oldest messages to stay within bounds.
+        """
+        size = _byte_size(data)
+        self._queue.append((data, size))
+        metrics = self._metrics
+        metrics["queued"] += 1
+        metrics["queued_bytes"] += size
+        settings = self._settings
+        while self._queue and (
+            metrics["queued"] > settings["max_queue"]
+            or metrics["queued_bytes"] > settings["max_queue_bytes"]
+        ):
+            _, dropped_size = self._queue.pop(0)
+            metrics["queued"] -= 1
+            metrics["queued_bytes"] -= dropped_size
+            metrics["dropped"] += 1
+
+
+class JSONCodec:
+    """
+    Encode messages as UTF-8 JSON. Works with anything `json.dumps`
+    accepts.
+    """
+
+    def encode(self, message):
+        import json
+
+        return json.dumps(message).encode("utf-8")
+
+    def decode(self, payload):
+        import json
+
+        return json.loads(bytes(payload).decode("utf-8"))
+
+
+class FlattedCodec:
+    """
+    Encode messages with `pyscript.flatted`, which (unlike JSON) supports
+    circular references.
+    """
+
+    def encode(self, message):
+        from pyscript import flatted
+
+        return flatted.stringify(message).encode("utf-8")
+
+    def decode(self, payload):
+        from pyscript import flatted
+
+        return flatted.parse(bytes(payload).decode("utf-8"))
+
+
+class CompactCodec:
+    """
+    Encode messages in a compact binary format, similar in spirit to
+    [MessagePack](https://msgpack.org/). Supports `None`, `bool`, `int`
+    (up to 64 bits), `float`, `str`, `bytes`, `list`, `tuple` (decoded as
+    a `list`) and `dict`.
+
+    Payloads are typically much smaller than JSON, especially for numbers.
+    """
+
+    _NONE = 0
+    _FALSE = 1
+    _TRUE = 2
+    _INT8 = 3
+    _INT32 = 4
+    _INT64 = 5
+    _FLOAT = 6
+    _STR = 7
+    _BYTES = 8
+    _LIST = 9
+    _DICT = 10
+
+    def __init__(self):
+        # Imported here, so pages not using this codec don't pay for it.
+        import struct
+
+        self._pack = struct.pack
+        self._unpack_from = struct.unpack_from
+
+    def encode(self, message):
+        parts = []
+        self._encode(message, parts)
+        return b"".join(parts)
+
+    def decode(self, payload):
+        value, _ = self._decode(memoryview(payload), 0)
+        return value
+
+    def _encode(self, value, parts):
+        if value is None:
+            parts.append(bytes([self._NONE]))
+        elif value is True:
+            parts.append(bytes([self._TRUE]))
+        elif value is False:
+            parts.append(bytes([self._FALSE]))
+        elif isinstance(value, int):
+            if -128 <= value < 128:
+                parts.append(self._pack(">Bb", self._INT8, value))
+            elif -(2**31) <= value < 2**31:
+                parts.append(self._pack(">Bi", self._INT32, value))
+            else:
+                parts.append(self._pack(">Bq", self._INT64, value))
+        elif isinstance(value, float):
+            parts.append(self._pack(">Bd", self._FLOAT, value))
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+            parts.append(self._pack(">BI", self._STR, len(data)))
+            parts.append(data)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            data = bytes(value)
+            parts.append(self._pack(">BI", self._BYTES, len(data)))
+            parts.append(data)
+        elif isinstance(value, (list, tuple)):
+            parts.append(self._pack(">BI", self._LIST, len(value)))
+            for item in value:
+                self._encode(item, parts)
+        elif isinstance(value, dict):
+            parts.append(self._pack(">BI", self._DICT, len(value)))
+            for key, item in value.items():
+                self._encode(key, parts)
+                self._encode(item, parts)
+        else:
+            raise TypeError(f"Cannot encode type {type(value).__name__}.")
+
+    def _decode(self, data, offset):
+        """
+        Decode the value at `offset` in `data`. Returns the value and the
+        offset just after it.
+        """
+        tag = data[offset]
+        offset += 1
+        if tag == self._NONE:
+            return None, offset
+        if tag == self._FALSE:
+            return False, offset
+        if tag == self._TRUE:
+            return True, offset
+        if tag == self._INT8:
+            return self._unpack_from(">b", data, offset)[0], offset + 1
+        if tag == self._INT32:
+            return self._unpack_from(">i", data, offset)[0], offset + 4
+        if tag == self._INT64:
+            return self._unpack_from(">q", data, offset)[0], offset + 8
+        if tag == self._FLOAT:
+            return self._unpack_from(">d", data, offset)[0], offset + 8
+        size = self._unpack_from(">I", data, offset)[0]
+        offset += 4
+        if tag == self._STR:
+            return bytes(data[offset : offset + size]).decode("utf-8"), offset + size
+        if tag == self._BYTES:
+            return bytes(data[offset : offset + size]), offset + size
+        if tag == self._LIST:
+            items = []
+            for _ in range(size):
+                item, offset = self._decode(data, offset)
+                items.append(item)
+            return items, offset
+        if tag == self._DICT:
+            result = {}
+            for _ in range(size):
+                key, offset = self._decode(data, offset)
+                result[key], offset = self._decode(data, offset)
+            return result, offset
+        raise ValueError(f"Unknown type tag {tag} in payload.")
+
+
+def encode_frame(payloads):
+    """
+    Pack a list of `bytes` `payloads` into a single frame, each prefixed
+    by its length as a 4-byte big-endian unsigned integer.
+    """
+    import struct
+
+    parts = []
+    for payload in payloads:
+        parts.append(struct.pack(">I", len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def decode_frame(frame):
+    """
+    Split a `frame` created by `encode_frame()` back into a list of
+    `memoryview` payloads (without copying).
+    """
+    import struct
+
+    data = memoryview(frame)
+    payloads = []
+    offset = 0
+    while offset < len(data):
+        size = struct.unpack_from(">I", data, offset)[0]
+        offset += 4
+        payloads.append(data[offset : offset + size])
+        offset += size
+    return payloads
+
+
+class FramedChannel:
+    """
+    Send and receive Python objects over a `WebSocket`, coalescing many
+    small messages into fewer, larger binary frames.
+
+    Messages passed to `send()` are encoded by the `codec` and held for
+    up to `window` seconds (or until `max_messages` messages or
+    `max_bytes` bytes are waiting), then sent together as one
+    length-prefixed binary frame (see `encode_frame()`). Incoming frames
+    are split and decoded, and each message is passed to the `onmessage`
+    handler. Both ends of the connection must use the same framing and
+    codec.
+
+    ```python
+    from pyscript import WebSocket
+    from pyscript.websocket import CompactCodec, FramedChannel
+
+
+    def on_message(message):
+        print(message["x"], message["y"])
+
+    ws = WebSocket(url="wss://example.com/telemetry")
+    channel = FramedChannel(ws, codec=CompactCodec(), onmessage=on_message)
+
+    # Hundreds of these per second become a handful of frames.
+    channel.send({"x": 10, "y": 20})
+    ```
+
+    The included codecs are `JSONCodec` (the default), `CompactCodec` and
+    `FlattedCodec`. Any object with `encode(message) -> bytes` and
+    `decode(payload) -> message` methods can be used as a codec.
+    """
+
+    def __init__(
+        self,
+        websocket,
+        codec=None,
+        window=0.005,
+        max_messages=256,
+        max_bytes=64 * 1024,
+        onmessage=None,
+    ):
+        """
+        Create a framed channel over `websocket`. See the class docs for
+        the other arguments.
+        """
+        self.websocket = websocket
+        self.codec = codec or JSONCodec()
+        self.window = window
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.onmessage = onmessage
+        self.stats = {
+            "messages_sent": 0,
+            "frames_sent": 0,
+            "messages_received": 0,
+            "frames_received": 0,
+        }
+        """Counts of messages and frames sent and received."""
+        self._pending = []
+        self._pending_bytes = 0
+        self._timer = None
+        self._flush_proxy = _create_proxy(self._on_timer)
+        websocket._listen(self)
+
+    def send(self, message):
+        """
+        Encode and queue `message`, to be sent in the next frame.
+        """
+        payload = self.codec.encode(message)
+        self._pending.append(payload)
+        self._pending_bytes += len(payload) + 4
+        if (
+            len(self._pending) >= self.max_messages
+            or self._pending_bytes >= self.max_bytes
+        ):
+            self.flush()
+        elif self._timer is None:
+            self._timer = js.setTimeout(self._flush_proxy, self.window * 1000)
+
+    def flush(self):
+        """
+        Send all queued messages now, as a single frame.
+        """
+        if self._timer is not None:
+            js.clearTimeout(self._timer)
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._pending_bytes = 0
+        self.websocket.send(encode_frame(pending))
+        self.stats["messages_sent"] += len(pending)
+        self.stats["frames_sent"] += 1
+
+    def close(self):
+        """
+        Send anything still queued, then stop receiving messages (the
+        WebSocket itself is left open).
+        """
+        self.flush()
+        self.websocket._unlisten(self)
+        self._close()
+
+    def _on_timer(self, *args):
+        self._timer = None
+        self.flush()
+
+    def _push(self, event):
+        """
+        Split an incoming frame and pass each decoded message on.
+        """
+        data = WebSocketEvent(event).data
+        if isinstance(data, str):
+            # Text messages aren't frames: treat each as one payload.
+            payloads = [data.encode("utf-8")]
+        else:
+            payloads = decode_frame(data)
+        self.stats["frames_received"] += 1
+        self.stats["messages_received"] += len(payloads)
+        if self.onmessage is None:
+            return
+        for payload in payloads:
+            message = self.codec.decode(payload)
+            if is_awaitable(self.onmessage):
+                asyncio.create_task(self.onmessage(message))
+            else:
+                self.onmessage(message)
+
+    def _close(self, *args):
+        """
+        The connection has closed: nothing more can be sent.
+        """
+        if self._timer is not None:
+            js.clearTimeout(self._timer)
+            self._timer = None
@@ -48,10 +48,22 @@ result = await worker.process_data([1, 2, 3, 4, 5])
 print(result)
 ```
 
+Spreading work across several identical workers with a `WorkerPool`:
+
+```python
+from pyscript.workers import WorkerPool
+
+
+# One worker per CPU core (the default size).
+async with WorkerPool("./primes.py", config={"packages": ["numpy"]}) as pool:
+    counts = await pool.map("count_primes", [10_000, 20_000, 30_000])
+```
+
 Key features:
 
 - Access (`await`) named workers via dictionary-like syntax.
 - Dynamically create workers from Python.
+- Spread calls across a pool of identical workers.
 - Cross-interpreter support (Pyodide and MicroPython).
 
 Worker access is asynchronous - you must `await workers[name]` to get
@@ -59,9 +71,12 @@ a reference to the worker. This is because workers may not be ready
 immediately at startup.
 """
 
+import asyncio
 import js
 import json
 from polyscript import workers as _polyscript_workers
+from pyscript.context import RUNNING_IN_WORKER
+from pyscript.ffi import _create_proxy, is_none, to_js
 
 
 class _ReadOnlyWorkersProxy:
@@ -109,7 +124,7 @@ class _ReadOnlyWorkersProxy:
         worker = await workers["my-worker"]
         ```
         """
-        return js.Reflect.get(_polyscript_workers, name)
+        return js.Reflect.get(_polyscript_workers, _aliases.get(name, name))
 
     def __getattr__(self, name):
         """
@@ -123,7 +138,7 @@ class _ReadOnlyWorkersProxy:
         worker = await workers.my_worker
         ```
         """
-        return js.Reflect.get(_polyscript_workers, name)
+        return js.Reflect.get(_polyscript_workers, _aliases.get(name, name))
 
 
 # Global workers proxy for accessing named workers.
@@ -175,7 +190,63 @@ async def create_named_worker(src, name, config=None, type="py"):
 
         **The worker script should define** `__export__` to specify which
         functions or objects are accessible from the main thread.
+
+    If a matching worker was started ahead of time with `prewarm()`, that
+    worker is returned instead of starting a new one. Startup timings are
+    recorded in `startup_times[name]`: `inject_ms` (adding the script tag),
+    `boot_ms` (until the worker was ready, including package installs) and
+    `wait_ms` (how long this call waited), plus whether the worker was
+    `warm`.
+    """
+    config_str = _config_to_str(config)
+    warm = _warm_workers.get((src, type, config_str))
+    if warm:
+        # Hand out a worker that was started ahead of time.
+        warm_name = warm.pop(0)
+        _aliases[name] = warm_name
+        timings = startup_times[warm_name]
+        timings["warm"] = True
+        startup_times[name] = timings
+        start = js.performance.now()
+        worker = await workers[name]
+        timings["wait_ms"] = js.performance.now() - start
+        return worker
+    start = _inject_worker(src, name, config_str, type)
+    worker = await workers[name]
+    startup_times[name]["boot_ms"] = js.performance.now() - start
+    startup_times[name]["wait_ms"] = startup_times[name]["boot_ms"]
+    return worker
+
+
+# (src, type, config) -> names of started workers not yet handed out.
+_warm_workers = {}
+# Requested worker name -> name of the warm worker handed out for it.
+_aliases = {}
+_warm_count = 0
+
+startup_times = {}
+"""
+Startup timings (in milliseconds) for each worker created from Python,
+keyed by worker name.
+"""
+
+
+def _config_to_str(config):
+    """
+    Return the worker `config` (dict or JSON string) as a string.
+    """
+    if not config:
+        return ""
+    if isinstance(config, str):
+        return config
+    return json.dumps(config)
+
+
+def _inject_worker(src, name, config_str, type):
+    """
+    Inject a `<script>` tag to start a worker. Returns the start time.
     """
+    start = js.performance.now()
     # Create script element for the worker.
     script = js.document.createElement("script")
     script.type = type
@@ -184,12 +255,925 @@ async def create_named_worker(src, name, config=None, type="py"):
     script.setAttribute("worker", "")
     script.setAttribute("name", name)
     # Add configuration if provided.
-    if config:
-        if isinstance(config, str):
-            config_str = config
-        else:
-            config_str = json.dumps(config)
+    if config_str:
         script.setAttribute("config", config_str)
-    # Inject the script into the document and await the result.
+    # Inject the script into the document.
     js.document.body.append(script)
-    return await workers[name]
+    startup_times[name] = {
+        "warm": False,
+        "inject_ms": js.performance.now() - start,
+        "boot_ms": None,
+        "wait_ms": None,
+    }
+    return start
+
+
+async def prewarm(src, config=None, type="py", count=1):
+    """
+    Start `count` workers running the `src` Python file, with the given
+    `config` and `type`, ahead of time. This returns once they are all
+    ready.
+
+    The next calls to `create_named_worker()` with the same `src`,
+    `config` and `type` get one of these warm workers straight away,
+    under the requested name, instead of waiting for a new interpreter to
+    boot and install its packages.
+
+    ```python
+    from pyscript import create_named_worker
+    from pyscript.workers import prewarm, startup_times
+
+
+    # At page load: pay the startup cost before the user needs it.
+    config = {"packages": ["numpy", "pandas"]}
+    await prewarm("./analysis.py", config=config, count=2)
+
+    # Later: this returns immediately.
+    worker = await create_named_worker(
+        "./analysis.py", "analysis", config=config
+    )
+    print(startup_times["analysis"])
+    ```
+
+    !!! info
+
+        Unless `packages_cache` is set to `never` in the configuration,
+        the packages installed by warm workers are cached by the browser,
+        which also speeds up any other worker using the same packages.
+    """
+    global _warm_count
+    config_str = _config_to_str(config)
+    names = []
+    for _ in range(count):
+        _warm_count += 1
+        name = f"warm-{_warm_count}"
+        start = _inject_worker(src, name, config_str, type)
+        names.append((name, start))
+        _warm_workers.setdefault((src, type, config_str), []).append(name)
+    for name, start in names:
+        await js.Reflect.get(_polyscript_workers, name)
+        startup_times[name]["boot_ms"] = js.performance.now() - start
+
+
+class PoolTask:
+    """
+    A single call to an exported worker function, scheduled on a
+    `WorkerPool`. Instances are returned by `WorkerPool.submit()` and
+    should not be created directly.
+
+    ```python
+    task = pool.submit("find_primes", 100_000)
+
+    # Wait for the worker to return the result.
+    result = await task.result()
+
+    # Or change your mind before a worker picks it up.
+    task.cancel()
+    ```
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+
+    def __init__(self, function, args):
+        """
+        Create a task to call the exported `function` with `args`.
+        """
+        self.function = function
+        self.args = args
+        self.state = PoolTask.PENDING
+        """One of `pending`, `running`, `done` or `cancelled`."""
+        self.worker = None
+        """Name of the worker that ran (or is running) this task."""
+        self._value = None
+        self._error = None
+        self._finished = asyncio.Event()
+        self._callbacks = []
+
+    def __repr__(self):
+        return f"<PoolTask {self.function} [{self.state}]>"
+
+    def done(self):
+        """
+        Return `True` if the task has a result, an error or was cancelled.
+        """
+        return self.state in (PoolTask.DONE, PoolTask.CANCELLED)
+
+    def cancelled(self):
+        """
+        Return `True` if the task was cancelled.
+        """
+        return self.state == PoolTask.CANCELLED
+
+    def cancel(self):
+        """
+        Cancel the task. Returns `True` if the task was cancelled.
+
+        A pending task is never sent to a worker. A running task cannot be
+        interrupted (the worker is busy running Python code) so its result
+        is simply discarded when it arrives.
+        """
+        if self.done():
+            return False
+        self.state = PoolTask.CANCELLED
+        self._finish()
+        return True
+
+    async def result(self):
+        """
+        Wait for and return the value returned by the worker function.
+
+        Re-raises any error raised by the worker function, or
+        `asyncio.CancelledError` if the task was cancelled.
+        """
+        await self._finished.wait()
+        if self.state == PoolTask.CANCELLED:
+            raise asyncio.CancelledError()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _resolve(self, value=None, error=None):
+        """
+        Record the outcome of the call, unless the task was cancelled.
+        """
+        if self.done():
+            return
+        self._value = value
+        self._error = error
+        self.state = PoolTask.DONE
+        self._finish()
+
+    def _finish(self):
+        self._finished.set()
+        for callback in self._callbacks:
+            callback(self)
+
+
+class _UnorderedResults:
+    """
+    Async iterator yielding the results of `tasks` in completion order.
+    (MicroPython has no async generators, hence this class.)
+    """
+
+    def __init__(self, tasks):
+        self._remaining = len(tasks)
+        self._finished = []
+        self._signal = asyncio.Event()
+        for task in tasks:
+            task._callbacks.append(self._on_done)
+
+    def _on_done(self, task):
+        self._finished.append(task)
+        self._signal.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._remaining == 0:
+            raise StopAsyncIteration
+        while not self._finished:
+            self._signal.clear()
+            await self._signal.wait()
+        self._remaining -= 1
+        return await self._finished.pop(0).result()
+
+
+_pool_count = 0
+
+
+class WorkerPool:
+    """
+    A pool of identical named workers, all running the same `src` Python
+    file, that share out calls to their exported functions.
+
+    Each worker has its own task queue. New tasks go to the least loaded
+    worker and a worker that runs out of work steals queued tasks from
+    the busiest one, so slow calls never leave other workers idle.
+
+    ```python
+    from pyscript.workers import WorkerPool
+
+
+    pool = WorkerPool(
+        "./primes.py",
+        size=4,
+        config={"packages": ["numpy"]},
+    )
+
+    # Call an exported function on whichever worker is free.
+    task = pool.submit("count_primes", 1_000_000)
+    print(await task.result())
+
+    # Apply a function to many values, results in order.
+    counts = await pool.map("count_primes", [10_000, 20_000, 30_000])
+
+    # Or handle results as soon as each one is ready.
+    async for count in pool.imap_unordered("count_primes", range(100)):
+        print(count)
+
+    # See what each worker is doing.
+    for worker in pool.health():
+        print(worker["name"], worker["state"], worker["completed"])
+
+    # Stop all the workers.
+    pool.terminate()
+    ```
+
+    Workers are started on first use, or explicitly with `await
+    pool.start()`. The pool also works as an async context manager that
+    starts the workers on entry and terminates them on exit.
+
+    !!! info
+
+        Just like any other named worker, **the worker script should
+        define** `__export__` to list the functions callable via the pool.
+    """
+
+    def __init__(self, src, size=None, type="py", config=None, name=None):
+        """
+        Create a pool of `size` workers running `src` with the optional
+        `config` (dict or JSON string) and `type` (`py` or `mpy`).
+
+        The `size` defaults to the number of logical CPU cores reported by
+        [`navigator.hardwareConcurrency`](https://developer.mozilla.org/en-US/docs/Web/API/Navigator/hardwareConcurrency).
+        Workers are named `<name>-0`, `<name>-1` and so on, where `name`
+        defaults to a unique `pool-<n>` value.
+        """
+        global _pool_count
+        if size is None:
+            size = getattr(js.navigator, "hardwareConcurrency", None) or 4
+        if size < 1:
+            raise ValueError("A worker pool needs at least one worker.")
+        if name is None:
+            _pool_count += 1
+            name = f"pool-{_pool_count}"
+        self.src = src
+        self.size = size
+        self.type = type
+        self.config = config
+        self.name = name
+        self._workers = [None] * size
+        self._queues = [[] for _ in range(size)]
+        self._health = [
+            {
+                "name": f"{name}-{index}",
+                "state": "stopped",
+                "completed": 0,
+                "failed": 0,
+                "busy_ms": 0,
+                "last_error": None,
+            }
+            for index in range(size)
+        ]
+        self._runners = []
+        # Tasks currently running on a worker.
+        self._running = set()
+        self._starting = 0
+        self._started = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def __repr__(self):
+        return f"<WorkerPool {self.name} [{self.size} x {self.src}]>"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        self.terminate()
+
+    async def start(self):
+        """
+        Start all the workers and wait until each has either started or
+        failed to start. Calling it again has no further effect.
+        """
+        if self._closed:
+            raise RuntimeError(f"Worker pool '{self.name}' has been terminated.")
+        if not self._runners:
+            self._starting = self.size
+            self._runners = [
+                asyncio.create_task(self._run(index)) for index in range(self.size)
+            ]
+        await self._started.wait()
+
+    def submit(self, function, *args):
+        """
+        Schedule a call to the exported `function` (by name) with `args` on
+        the least busy worker. Returns a `PoolTask`.
+
+        The workers are started if this hasn't happened yet.
+        """
+        if self._closed:
+            raise RuntimeError(f"Worker pool '{self.name}' has been terminated.")
+        task = PoolTask(function, args)
+        if not self._runners:
+            asyncio.create_task(self.start())
+        candidates = [
+            index
+            for index, health in enumerate(self._health)
+            if health["state"] != "failed"
+        ]
+        if not candidates:
+            task._resolve(error=RuntimeError("No worker in the pool is running."))
+            return task
+        index = min(candidates, key=self._load)
+        self._queues[index].append(task)
+        self._wakeup.set()
+        return task
+
+    async def map(self, function, iterable):
+        """
+        Call the exported `function` once for each item in `iterable`,
+        spread across the pool, and return the results in order.
+
+        If any call fails, all the remaining calls are cancelled and the
+        error is raised.
+        """
+        tasks = [self.submit(function, item) for item in iterable]
+        results = []
+        try:
+            for task in tasks:
+                results.append(await task.result())
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return results
+
+    def imap_unordered(self, function, iterable):
+        """
+        Like `map()`, but return an async iterator that yields each result
+        as soon as it is ready, regardless of order.
+
+        ```python
+        async for result in pool.imap_unordered("analyse", chunks):
+            display(result)
+        ```
+        """
+        return _UnorderedResults([self.submit(function, item) for item in iterable])
+
+    def cancel_pending(self):
+        """
+        Cancel every task still waiting in a queue. Returns the number of
+        tasks cancelled.
+        """
+        count = 0
+        for queue in self._queues:
+            while queue:
+                if queue.pop().cancel():
+                    count += 1
+        return count
+
+    def health(self):
+        """
+        Return a list of dicts (one per worker) describing the `name`,
+        `state` (`stopped`, `starting`, `idle`, `busy`, `failed` or
+        `terminated`), number of `queued`, `completed` and `failed` tasks,
+        total `busy_ms` and the `last_error` seen by each worker.
+        """
+        result = []
+        for health, queue in zip(self._health, self._queues):
+            stats = dict(health)
+            stats["queued"] = len(queue)
+            result.append(stats)
+        return result
+
+    def terminate(self):
+        """
+        Cancel all pending and running tasks and terminate every worker in
+        the pool.
+
+        Waiting for the result of a cancelled task raises
+        `asyncio.CancelledError`. A terminated pool cannot be restarted.
+        """
+        self._closed = True
+        self.cancel_pending()
+        # Their workers are about to go, so these would never finish.
+        for task in list(self._running):
+            task.cancel()
+        self._running.clear()
+        for index, worker in enumerate(self._workers):
+            if worker is not None:
+                worker.terminate()
+                self._workers[index] = None
+            self._health[index]["state"] = "terminated"
+        # Let idle runners notice the pool is closed.
+        self._wakeup.set()
+        self._started.set()
+
+    def _load(self, index):
+        """
+        The number of tasks waiting for, or running in, the worker at
+        `index`.
+        """
+        busy = 1 if self._health[index]["state"] == "busy" else 0
+        return len(self._queues[index]) + busy
+
+    def _next_task(self, index):
+        """
+        Take the next task for the worker at `index`, stealing from the
+        back of the busiest queue if its own queue is empty.
+        """
+        queue = self._queues[index]
+        if not queue:
+            victim = max(self._queues, key=len)
+            if not victim:
+                return None
+            queue.append(victim.pop())
+        task = queue.pop(0)
+        return None if task.cancelled() else task
+
+    def _worker_started(self):
+        self._starting -= 1
+        if self._starting == 0:
+            self._started.set()
+
+    async def _run(self, index):
+        """
+        Start the worker at `index`, then run queued tasks on it until the
+        pool is terminated.
+        """
+        health = self._health[index]
+        health["state"] = "starting"
+        try:
+            worker = await create_named_worker(
+                self.src, health["name"], self.config, self.type
+            )
+        except Exception as error:
+            health["state"] = "failed"
+            health["last_error"] = str(error)
+            self._worker_started()
+            # Hand any queued work to the other workers.
+            orphans, self._queues[index] = self._queues[index], []
+            for task in orphans:
+                if not task.done():
+                    self._resubmit(task)
+            return
+        if self._closed:
+            worker.terminate()
+            self._worker_started()
+            return
+        self._workers[index] = worker
+        health["state"] = "idle"
+        self._worker_started()
+        while not self._closed:
+            task = self._next_task(index)
+            if task is None:
+                if not any(self._queues):
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                continue
+            task.state = PoolTask.RUNNING
+            task.worker = health["name"]
+            health["state"] = "busy"
+            self._running.add(task)
+            start = js.performance.now()
+            try:
+                value = await getattr(worker, task.function)(*task.args)
+            except Exception as error:
+                health["failed"] += 1
+                health["last_error"] = str(error)
+                task._resolve(error=error)
+            else:
+                health["completed"] += 1
+                task._resolve(value)
+            finally:
+                self._running.discard(task)
+            health["busy_ms"] += js.performance.now() - start
+            if not self._closed:
+                health["state"] = "idle"
+
+    def _resubmit(self, task):
+        """
+        Put a `task` from a failed worker back into the pool.
+        """
+        alive = [
+            index
+            for index, health in enumerate(self._health)
+            if health["state"] != "failed"
+        ]
+        if alive:
+            self._queues[min(alive, key=self._load)].append(task)
+            self._wakeup.set()
+        else:
+            task._resolve(error=RuntimeError("No worker in the pool is running."))
+
+
+class CancelToken:
+    """
+    Passed as the first argument to a `streamable` worker function, so it
+    can check whether the caller has cancelled the task.
+
+    When shared memory is available (see `pyscript.shared`) the flag is
+    set by the main thread immediately, so it can be checked in tight
+    loops. Otherwise it is set when the worker next handles a request.
+    """
+
+    def __init__(self, flag=None):
+        """
+        Create a token, optionally backed by a shared `flag` buffer.
+        """
+        self._cancelled = False
+        self._flag = None
+        if not is_none(flag):
+            from pyscript.shared import SharedArray
+
+            self._flag = SharedArray(dtype="int32", buffer=flag)
+
+    @property
+    def cancelled(self):
+        """
+        `True` once the task has been cancelled.
+        """
+        if not self._cancelled and self._flag is not None:
+            self._cancelled = self._flag.load(0) == 1
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Mark the task as cancelled.
+        """
+        self._cancelled = True
+        if self._flag is not None:
+            self._flag.store(0, 1)
+
+
+# Stream id -> {"generator", "token", "running"} for streams running in this
+# worker.
+_streams = {}
+_stream_count = 0
+
+
+async def _close_stream(stream_id):
+    """
+    Forget the stream `stream_id`, close its generator (which must not be
+    running) and let go of its cancellation flag.
+    """
+    stream = _streams.pop(stream_id, None)
+    if stream is None:
+        return
+    generator = stream["generator"]
+    if hasattr(generator, "aclose"):
+        await generator.aclose()
+    else:
+        generator.close()
+    stream["token"]._flag = None
+
+
+def streamable(func):
+    """
+    Decorate a generator function (or, in Pyodide, an async generator
+    function) in a worker so the main thread can consume what it yields
+    via `stream()`, and cancel it part way through.
+
+    The function receives a `CancelToken` as its first argument, followed
+    by the arguments passed to `stream()`.
+
+    ```python
+    from pyscript.workers import streamable
+
+
+    @streamable
+    def count_up(token, limit):
+        for i in range(limit):
+            if token.cancelled:
+                return
+            yield i
+
+
+    __export__ = ["count_up"]
+    ```
+
+    The decorated function must still be listed in `__export__`.
+    """
+
+    async def exported(operation, *args):
+        global _stream_count
+        if operation == "start":
+            flag, call_args = args
+            token = CancelToken(flag)
+            _stream_count += 1
+            _streams[_stream_count] = {
+                "generator": func(token, *call_args),
+                "token": token,
+                "running": False,
+            }
+            return _stream_count
+        stream_id = args[0]
+        stream = _streams.get(stream_id)
+        if stream is None:
+            return to_js([True, []])
+        generator, token = stream["generator"], stream["token"]
+        if operation == "cancel":
+            token.cancel()
+            # A running generator can't be closed: the batch being collected
+            # sees the cancellation and closes it once the generator yields.
+            if not stream["running"]:
+                await _close_stream(stream_id)
+            return to_js([True, []])
+        # operation == "next": collect up to `size` items, for at most
+        # `interval` milliseconds.
+        size, interval = args[1], args[2]
+        deadline = js.performance.now() + interval
+        items = []
+        done = False
+        stream["running"] = True
+        try:
+            while len(items) < size and js.performance.now() < deadline:
+                if token.cancelled:
+                    done = True
+                    break
+                if hasattr(generator, "__anext__"):
+                    items.append(await generator.__anext__())
+                else:
+                    items.append(next(generator))
+        except (StopIteration, StopAsyncIteration):
+            done = True
+        except Exception:
+            stream["running"] = False
+            await _close_stream(stream_id)
+            raise
+        stream["running"] = False
+        if done or token.cancelled:
+            await _close_stream(stream_id)
+        # Converted here, so the reply doesn't leave a proxy behind.
+        return to_js([done, items])
+
+    try:
+        exported.__name__ = func.__name__
+        exported.__doc__ = func.__doc__
+    except AttributeError:
+        # MicroPython doesn't support setting attributes on functions.
+        pass
+    return exported
+
+
+class TaskStream:
+    """
+    An async iterator over the values yielded by a `streamable` worker
+    function. Created via `stream()`.
+
+    ```python
+    from pyscript import workers
+    from pyscript.workers import stream
+
+
+    worker = await workers["counter"]
+    task = stream(worker, "count_up", 1_000_000)
+    async for value in task:
+        if value > 1000:
+            await task.cancel()
+    ```
+
+    Values are fetched from the worker in batches of up to `batch` items,
+    or whatever was yielded in `interval` milliseconds, whichever comes
+    first. The worker only runs the generator while a batch is being
+    fetched, so a slow consumer is never flooded with results.
+    """
+
+    def __init__(self, worker, function, args, batch=64, interval=50):
+        """
+        Stream the values yielded by the `streamable` `function` in
+        `worker` when called with `args`.
+        """
+        from pyscript.shared import SHARED_MEMORY, SharedArray
+
+        self._call = getattr(worker, function)
+        self._args = list(args)
+        self.batch = batch
+        self.interval = interval
+        self._flag = SharedArray(1, dtype="int32") if SHARED_MEMORY else None
+        self._id = None
+        self._buffer = []
+        self._done = False
+        self.cancelled = False
+        """`True` if the stream was cancelled."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer:
+            if self._done:
+                raise StopAsyncIteration
+            await self._fetch()
+        return self._buffer.pop(0)
+
+    async def _fetch(self):
+        if self._id is None:
+            flag = None if self._flag is None else self._flag.buffer
+            self._id = await self._call("start", flag, self._args)
+            if self.cancelled:
+                # Cancelled while starting, so before there was an id to
+                # cancel: tell the worker now, so it closes the generator.
+                await self._call("cancel", self._id)
+                return
+        done, items = await self._call("next", self._id, self.batch, self.interval)
+        if not self.cancelled:
+            self._buffer.extend(items)
+            self._done = done
+
+    async def cancel(self):
+        """
+        Cancel the task. With shared memory the worker sees this straight
+        away via its `CancelToken`, even in the middle of a batch. Values
+        not yet consumed are discarded.
+        """
+        self.cancelled = True
+        self._done = True
+        self._buffer = []
+        if self._flag is not None:
+            self._flag.store(0, 1)
+        if self._id is not None:
+            await self._call("cancel", self._id)
+
+
+def stream(worker, function, *args, batch=64, interval=50):
+    """
+    Call the `streamable` `function` (by name) in `worker` with `args`,
+    and return a `TaskStream` to iterate over the values it yields.
+
+    ```python
+    from pyscript import workers
+    from pyscript.workers import stream
+
+
+    worker = await workers["primes"]
+    async for progress in stream(worker, "find_primes", 1_000_000):
+        print(progress)
+    ```
+    """
+    return TaskStream(worker, function, args, batch=batch, interval=interval)
+
+
+# Objects transferred to this worker, keyed by the name they were sent
+# under, waiting to be received.
+_inbox = {}
+_inbox_ready = {}
+
+
+# Wraps the Python handler in a JavaScript listener that ignores all but
+# `transfer()` messages, so other traffic never has to cross into Python.
+_TRANSFER_LISTENER = """
+return event => {
+  const data = event.data;
+  if (data && data.pyscriptTransfer != null)
+    handler(data.pyscriptTransfer, data.value);
+};
+"""
+
+
+def _on_transfer(key, value):
+    """
+    Handle a `transfer()` of `value` under `key` from the main thread.
+    """
+    _inbox.setdefault(key, []).append(value)
+    if key in _inbox_ready:
+        _inbox_ready[key].set()
+
+
+def _worker_script(name):
+    """
+    Return the `<script>` element of the named worker.
+    """
+    name = _aliases.get(name, name)
+    script = js.document.querySelector(f'script[worker][name="{name}"]')
+    if script is None or not hasattr(script, "xworker"):
+        raise KeyError(f"No worker named '{name}'.")
+    return script
+
+
+def transfer(worker, key, value):
+    """
+    Transfer a JavaScript `value` to the named `worker`, where
+    `receive(key)` returns it. Use this, from the main thread, for objects
+    that cannot be copied to a worker, only handed over (an
+    [OffscreenCanvas](https://developer.mozilla.org/en-US/docs/Web/API/OffscreenCanvas),
+    `ImageBitmap`, `VideoFrame`, `ReadableStream`, `MessagePort` or
+    `ArrayBuffer`). Once transferred, the value is no longer usable on the
+    main thread.
+
+    Worker functions receive copies of their arguments, which is why these
+    objects must travel this way instead. Only transfer to a worker after
+    it is ready (i.e. after `await workers[name]`), and import
+    `pyscript.workers` in the worker before then.
+
+    ```python
+    from pyscript import document, workers
+    from pyscript.workers import transfer
+
+
+    await workers["renderer"]
+    offscreen = document.getElementById("view").transferControlToOffscreen()
+    transfer("renderer", "view", offscreen)
+    ```
+    """
+    script = _worker_script(worker)
+    message = js.Object.new()
+    message.pyscriptTransfer = key
+    message.value = value
+    transferable = [] if value is None or is_none(value) else [value]
+    script.xworker.postMessage(message, to_js(transferable))
+
+
+async def receive(key):
+    """
+    In a worker, wait for, and return, the next value sent by the main
+    thread under `key` via `transfer()`.
+
+    ```python
+    from pyscript.workers import receive
+
+
+    canvas = await receive("view")
+    ctx = canvas.getContext("2d")
+    ctx.fillRect(0, 0, 100, 100)  # Shows on the page.
+    ```
+    """
+    while not _inbox.get(key):
+        ready = _inbox_ready.setdefault(key, asyncio.Event())
+        await ready.wait()
+        ready.clear()
+    return _inbox[key].pop(0)
+
+
+class ReceivedFrames:
+    """
+    In a worker, an async iterator over the video frames (`VideoFrame` or
+    `ImageBitmap` objects) the main thread sends under a key via
+    `pyscript.media.stream_to_worker()`. Created via `frames()`.
+
+    If the worker is slower than the video, older frames are closed and
+    skipped (and counted in `dropped`), so each iteration gets the latest
+    frame. Call `close()` on each frame when you have finished with it, to
+    release its memory.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.received = 0
+        self.dropped = 0
+        self._reader = None
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        if self._reader is not None:
+            # Frames arrive over a transferred ReadableStream.
+            result = await self._reader.read()
+            if result.done:
+                self._done = True
+                raise StopAsyncIteration
+            self.received += 1
+            return result.value
+        frame = await receive(self.key)
+        if not is_none(frame) and hasattr(frame, "getReader"):
+            self._reader = frame.getReader()
+            return await self.__anext__()
+        # Skip to the most recent frame.
+        pending = _inbox.get(self.key, [])
+        while pending and not is_none(frame):
+            self.dropped += 1
+            frame.close()
+            frame = pending.pop(0)
+        if frame is None or is_none(frame):
+            self._done = True
+            raise StopAsyncIteration
+        self.received += 1
+        return frame
+
+
+def frames(key="video"):
+    """
+    In a worker, return a `ReceivedFrames` async iterator over the video
+    frames the main thread streams under `key` via
+    `pyscript.media.stream_to_worker()`.
+
+    ```python
+    from pyscript.workers import frames
+
+
+    async for frame in frames("camera"):
+        ctx.drawImage(frame, 0, 0)
+        frame.close()
+    ```
+    """
+    return ReceivedFrames(key)
+
+
+def _listen():
+    if RUNNING_IN_WORKER:
+        make_listener = js.Function.new("handler", _TRANSFER_LISTENER)
+        js.addEventListener("message", make_listener(_create_proxy(_on_transfer)))
+
+
+_listen()